@@ -0,0 +1,119 @@
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Tuple
+
+_caches: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+class TTLCache:
+    """A thread-safe in-memory cache, whose entries expire after `ttl` seconds.
+
+    The least recently used entry is evicted first, when the cache is full.
+    Keys are tuples, so that all the entries starting with the same values
+    (e.g. the same username) can be invalidated at once.
+
+    Attributes:
+        ttl (float): time to live of each entry in seconds.
+        maxsize (int): maximum number of entries kept in the cache.
+    """
+    def __init__(self, ttl: float = 300, maxsize: int = 128):
+        """Initialize TTLCache.
+
+        Args:
+            ttl (float): time to live of each entry in seconds.
+            maxsize (int): maximum number of entries kept in the cache.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        _caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Tuple[Hashable, ...]) -> bool:
+        with self._lock:
+            return self._get(key) is not None
+
+    def _get(self, key: Tuple[Hashable, ...]) -> Any:
+        """Get the entry of the key, dropping it if it's expired. Not thread-safe."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry
+
+    def get(self, key: Tuple[Hashable, ...], default: Any = None) -> Any:
+        """Get the cached value of the key.
+
+        Args:
+            key (Tuple[Hashable, ...]): key of the entry.
+            default (Any): value to return if the key is not cached or expired.
+
+        Returns:
+            Any: the cached value or `default`.
+        """
+        with self._lock:
+            entry = self._get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        """Cache the value under the key.
+
+        Args:
+            key (Tuple[Hashable, ...]): key of the entry.
+            value (Any): value to cache.
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, *key_prefix: Hashable) -> None:
+        """Remove all the entries, whose keys start with the given values.
+
+        Args:
+            *key_prefix (Hashable): leading values of the keys to remove, e.g. a username.
+        """
+        n = len(key_prefix)
+        with self._lock:
+            for key in [key for key in self._data if key[:n] == key_prefix]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._data.clear()
+
+
+def invalidate(*key_prefix: Hashable) -> None:
+    """Remove the entries starting with the given values from all the caches,
+    e.g. after following or unfollowing a user.
+
+    Args:
+        *key_prefix (Hashable): leading values of the keys to remove, e.g. a username.
+
+    Examples:
+        >>> from crawlinsta import cache
+        >>> cache.invalidate("instagram_username")
+    """
+    for cache in list(_caches):
+        cache.invalidate(*key_prefix)
+
+
+def clear_all() -> None:
+    """Remove all the entries from all the caches.
+
+    Examples:
+        >>> from crawlinsta import cache
+        >>> cache.clear_all()
+    """
+    for cache in list(_caches):
+        cache.clear()
@@ -2,7 +2,7 @@ from .user_info import collect_user_info
 from .posts_of_user import collect_posts_of_user
 from .reels_of_user import collect_reels_of_user
 from .tagged_posts_of_user import collect_tagged_posts_of_user
-from .friendship_status import get_friendship_status
+from .friendship_status import get_friendship_status, get_friendship_statuses
 from .followers_of_user import collect_followers_of_user
 from .followings_of_user import collect_followings_of_user
 from .following_hashtags_of_user import collect_following_hashtags_of_user
@@ -11,7 +11,8 @@ from .comments_of_post import collect_comments_of_post
 from .keyword_search import search_with_keyword
 from .top_posts_of_hashtag import collect_top_posts_of_hashtag
 from .posts_by_music_id import collect_posts_by_music_id
-from .media import download_media
+from .media import download_media, download_media_many
+from .batch import collect_in_parallel
 
 __all__ = [
     "collect_user_info",
@@ -19,6 +20,7 @@ __all__ = [
     "collect_reels_of_user",
     "collect_tagged_posts_of_user",
     "get_friendship_status",
+    "get_friendship_statuses",
     "collect_followers_of_user",
     "collect_followings_of_user",
     "collect_following_hashtags_of_user",
@@ -27,5 +29,7 @@ __all__ = [
     "search_with_keyword",
     "collect_top_posts_of_hashtag",
     "collect_posts_by_music_id",
-    "download_media"
+    "download_media",
+    "download_media_many",
+    "collect_in_parallel"
 ]
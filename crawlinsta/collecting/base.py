@@ -1,21 +1,36 @@
-import json
 import logging
-import random
 import re
 import time
 from pydantic import Json
-from urllib.parse import quote, urlencode, parse_qs
+from urllib.parse import quote, urlencode, urlparse
 from seleniumwire.request import Request
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.remote.webelement import WebElement
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union, List, Dict, Any, Sequence
-from ..schemas import Posts, Users, UserProfile
-from ..utils import search_request, get_json_data, filter_requests
-from ..data_extraction import extract_post, extract_id
-from ..constants import JsonResponseContentType, INSTAGRAM_DOMAIN
+from typing import Union, List, Dict, Any, Optional, Sequence, Tuple, Set
+from ..schemas import Post, Posts, Users, UserProfile
+from ..utils import (
+    search_request, get_json_data, filter_requests, get_default_result, wait_for_request, get_request_data,
+    random_seconds
+)
+from ..data_extraction import extract_post, extract_id, create_users_list
+from ..cache import TTLCache
+from ..decorators import skip_caching
+from ..constants import (
+    JsonResponseContentType, GRAPHQL_API_URL, VIEWER_ID, VIEWER_ID_FORM_FIELD, USERS_DIALOG_BOTTOM_XPATH,
+    POST_ID_META_CSS_SELECTOR
+)
 
 logger = logging.getLogger("crawlinsta")
 
+# profile data of the users keyed by their usernames, so that collecting several
+# things of the same user doesn't wait for the profile response each time
+_user_data_cache = TTLCache(300, maxsize=1024)
+
+_POST_ID_RE = re.compile(r"(\d+)")
+
 
 class CollectBase:
     """Base class for collecting data.
@@ -23,7 +38,14 @@ class CollectBase:
     Attributes:
         driver (Union[Chrome, Edge, Firefox, Safari, Remote]): The selenium web driver.
         url (str): The URL to load.
+        missing_page_retries (int): The number of times a page is asked for again,
+         if its response isn't captured, e.g. because Instagram rate-limits the requests.
+        backoff_seconds (Tuple[int, int]): The range of seconds to back off before
+         asking for a missing page again.
     """
+    missing_page_retries: int = 1
+    backoff_seconds: Tuple[int, int] = (20, 30)
+
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                  url: str) -> None:
@@ -39,7 +61,11 @@ class CollectBase:
     def load_webpage(self) -> None:
         """Load webpage."""
         self.driver.get(self.url)
-        time.sleep(random.SystemRandom().randint(4, 6))
+        self.wait_for_webpage()
+
+    def wait_for_webpage(self) -> None:
+        """Wait for the webpage to be loaded."""
+        time.sleep(random_seconds(4, 6))
 
     def fetch_data(self) -> None:
         """Fetching data."""
@@ -73,6 +99,26 @@ class CollectBase:
         """
         return {}
 
+    def paginate(self) -> bool:
+        """Load and extract the following pages until `continue_fetching` says
+        it's enough. The pages are loaded one after another without pausing, only
+        if the response of a page isn't captured, it backs off and asks for the
+        page again, since Instagram may hold back the responses when rate-limiting.
+
+        Returns:
+            bool: True if all the pages are extracted, False if a page is not found.
+        """
+        while self.continue_fetching():
+            self.fetch_more_data()
+            retries = 0
+            while not self.extract_data():
+                if retries == self.missing_page_retries:
+                    return False
+                retries += 1
+                time.sleep(random_seconds(*self.backoff_seconds))
+                self.fetch_more_data()
+        return True
+
     def collect(self) -> Json:
         """Collect data.
 
@@ -91,7 +137,14 @@ class UserIDRequiredCollect(CollectBase):
         user_id (Optional[int]): The user id.
         user_data (Optional[Dict[str, Any]]): The user data dictionary.
         url (str): The URL to load.
+        captured_requests (List[Request]): The requests captured while loading the webpage.
+        reuse_shown_profile (bool): Whether the profile page already shown by the driver
+         is used instead of loading it again, if the profile of the user is cached.
+         Only for the collectors, which open a dialog on the profile page instead of
+         relying on the responses of loading the page.
     """
+    reuse_shown_profile: bool = False
+
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                  username: str,
@@ -107,6 +160,72 @@ class UserIDRequiredCollect(CollectBase):
         self.username = username
         self.user_id: Union[str, None] = None
         self.user_data: Union[Dict[str, Any], None] = None
+        self.captured_requests: List[Request] = []
+
+    def load_webpage(self) -> None:
+        """Load webpage. If the driver still shows the profile page of the user, e.g.
+        after collecting its followers, and its profile is cached, the page is not
+        loaded again. A dialog left open on the page is closed first."""
+        if self.reuse_shown_profile and self.shows_profile():
+            self.user_data = _user_data_cache.get((self.username,))
+            if self.user_data is not None and self.close_profile_dialog():
+                return
+        super().load_webpage()
+
+    def get_url_path(self, url: str) -> str:
+        """Get the normalized path of the url, with a trailing slash and in lower
+        case, since Instagram doesn't distinguish the cases of the usernames.
+
+        Args:
+            url (str): The url.
+
+        Returns:
+            str: The normalized path of the url.
+        """
+        return urlparse(url).path.rstrip("/").lower() + "/"
+
+    def shows_profile(self) -> bool:
+        """Check if the driver shows the profile page of the user, either as it
+        is or with one of its dialogs open, e.g. `/{username}/followers/`.
+
+        Returns:
+            bool: True if the profile page of the user is shown, False otherwise.
+        """
+        return self.get_url_path(self.driver.current_url).startswith(self.get_url_path(self.url))
+
+    def close_profile_dialog(self) -> bool:
+        """Close the dialog open on the shown profile page by going back in the
+        history of the browser, and wait until the profile page is shown alone,
+        so that its buttons can be clicked again.
+
+        Returns:
+            bool: True if no dialog is open anymore, False if it wasn't closed in time.
+        """
+        profile_path = self.get_url_path(self.url)
+        if self.get_url_path(self.driver.current_url) == profile_path:
+            return True
+        self.driver.back()
+        try:
+            WebDriverWait(self.driver, 10).until(
+                lambda driver: self.get_url_path(driver.current_url) == profile_path)
+        except TimeoutException:
+            logger.warning(f"Dialog on the profile page of user '{self.username}' isn't closed, "
+                           f"loading the page again.")
+            return False
+        return True
+
+    def wait_for_webpage(self) -> None:
+        """Wait until the response with the user profile is captured. The captured
+        requests are kept, so that they are loaded from the driver only once.
+
+        If the profile of the user was captured in the last 5 minutes, it's used
+        instead and nothing is waited for."""
+        self.user_data = _user_data_cache.get((self.username,))
+        if self.user_data is not None:
+            return
+        self.captured_requests = wait_for_request(self.driver, GRAPHQL_API_URL,
+                                                  JsonResponseContentType.text_javascript,
+                                                  self.check_request_data_for_user)
 
     def check_request_data_for_user(self, request: Request) -> bool:
         """Check if the request data is valid.
@@ -118,9 +237,11 @@ class UserIDRequiredCollect(CollectBase):
         Returns:
             bool: True if the request data is valid, False otherwise.
         """
-        request_data = parse_qs(request.body.decode())
-        variables = json.loads(request_data.get("variables", ["{}"])[0])
-        if request_data.get("av", [''])[0] != "17841461911219001":
+        # cheap check on the raw body before parsing it
+        if VIEWER_ID_FORM_FIELD not in request.body:
+            return False
+        request_data, variables = get_request_data(request)
+        if request_data.get("av", [''])[0] != VIEWER_ID:
             return False
         elif not variables:
             return False
@@ -137,21 +258,23 @@ class UserIDRequiredCollect(CollectBase):
         Raises:
             ValueError: If the user is not found.
         """
-        json_requests = filter_requests(self.driver.requests,
-                                        JsonResponseContentType.text_javascript)
-
-        if not json_requests:
-            raise ValueError(f"User '{self.username}' not found.")
-        target_url = f"{INSTAGRAM_DOMAIN}/api/graphql"
-        idx = search_request(json_requests, target_url,
-                             JsonResponseContentType.text_javascript,
-                             self.check_request_data_for_user)
-        if idx is None:
-            raise ValueError(f"User '{self.username}' not found.")
-        request = json_requests.pop(idx)  # type: ignore
-        json_data = get_json_data(request.response)
-        self.user_data = json_data["data"]['user']
-        self.user_id = extract_id(json_data["data"]['user'])  # type: ignore
+        if self.user_data is None:
+            json_requests = filter_requests(self.captured_requests or self.driver.requests,
+                                            JsonResponseContentType.text_javascript)
+
+            if not json_requests:
+                raise ValueError(f"User '{self.username}' not found.")
+            target_url = GRAPHQL_API_URL
+            idx = search_request(json_requests, target_url,
+                                 JsonResponseContentType.text_javascript,
+                                 self.check_request_data_for_user)
+            if idx is None:
+                raise ValueError(f"User '{self.username}' not found.")
+            request = json_requests.pop(idx)  # type: ignore
+            json_data = get_json_data(request.response)
+            self.user_data = json_data["data"]['user']
+            _user_data_cache.set((self.username,), self.user_data)
+        self.user_id = extract_id(self.user_data)  # type: ignore
         return self.user_data["is_private"]  # type: ignore
 
 
@@ -166,9 +289,12 @@ class CollectPostsBase(UserIDRequiredCollect):
         target_url (str): The target URL to search for.
         collect_type (str): The type of data to collect.
         json_data_key (str): The key to extract the json data from.
-        json_data_list (List[Dict[str, Any]]): The list of json data.
+        posts (List[Post]): The posts extracted so far.
+        page_info (Dict[str, Any]): The paging information of the last extracted page.
+        cursor (str): The after cursor of the last extracted page, an empty string for the first page.
         remaining (int): The remaining number of posts to collect.
-        json_requests (List[Dict[str, Any]]): The list of json requests.
+        page_requests (Dict[str, Request]): The captured requests of the pages, keyed by their cursors.
+        indexed_request_ids (Set[Any]): The ids of the requests indexed already.
         access_keys (Sequence[str]): The keys to access the post data.
     """
     def __init__(self,
@@ -202,12 +328,49 @@ class CollectPostsBase(UserIDRequiredCollect):
         self.response_content_type = response_content_type
         self.collect_type = collect_type
         self.json_data_key = json_data_key
-        self.json_data_list: List[Dict[str, Any]] = []
+        self.posts: List[Post] = []
+        self.page_info: Dict[str, Any] = {}
+        self.cursor = ""
         self.remaining = n
-        self.json_requests: List[Request] = []
+        self.page_requests: Dict[str, Request] = {}
+        self.indexed_request_ids: Set[Any] = set()
         self.access_keys = access_keys
         self.no_data_found = False
 
+    def is_page_variables(self, variables: Dict[str, Any]) -> bool:
+        """Check if the graphql variables of a request ask for a page of the user,
+        the variables differ between the feeds.
+
+        Args:
+            variables (Dict[str, Any]): The graphql variables of the request.
+
+        Returns:
+            bool: True if the variables ask for a page of the user, False otherwise.
+        """
+        raise NotImplementedError
+
+    def get_request_cursor(self, request: Request) -> Optional[str]:
+        """Get the cursor of the page requested by the request.
+
+        Args:
+            request (Request): The request to check.
+
+        Returns:
+            Optional[str]: The after cursor of the requested page, an empty string for
+            the first page, None if the request doesn't request a page of the user.
+        """
+        # cheap check on the raw body before parsing it
+        if VIEWER_ID_FORM_FIELD not in request.body:
+            return None
+        request_data, variables = get_request_data(request)
+        if request_data.get("av", [''])[0] != VIEWER_ID:
+            return None
+        elif not variables:
+            return None
+        elif not self.is_page_variables(variables):
+            return None
+        return variables.get("after", "")
+
     def check_request_data(self, request: Request, after: str = "") -> bool:
         """Check request data.
 
@@ -218,7 +381,29 @@ class CollectPostsBase(UserIDRequiredCollect):
         Returns:
             bool: True if the request data is valid, False otherwise.
         """
-        raise NotImplementedError
+        return self.get_request_cursor(request) == after
+
+    def index_requests(self, requests: List[Request]) -> None:
+        """Index the requests of the pages by their cursors. Each captured request is
+        parsed only once, afterward a page is looked up directly by its cursor instead
+        of checking all the requests captured so far again.
+
+        Args:
+            requests (List[Request]): The newly captured requests.
+        """
+        for request in requests:
+            if request.url != self.target_url:
+                continue
+            # a request can be in several snapshots, e.g. captured together with the
+            # user profile and again while waiting for the first page
+            if request.id is not None:
+                if request.id in self.indexed_request_ids:
+                    continue
+                self.indexed_request_ids.add(request.id)
+            cursor = self.get_request_cursor(request)
+            if cursor is not None:
+                # the first captured request of a page is used, same as `search_request`
+                self.page_requests.setdefault(cursor, request)
 
     def fetch_data(self) -> None:
         """Fetching data.
@@ -226,30 +411,42 @@ class CollectPostsBase(UserIDRequiredCollect):
         Raises:
             ValueError: If the user is not found.
         """
-
-        self.json_requests += filter_requests(self.driver.requests,
-                                              self.response_content_type)
+        json_requests: List[Request] = []
+        if self.captured_requests:
+            # the first page is usually captured together with the user profile already
+            json_requests = filter_requests(self.captured_requests, self.response_content_type)
+            self.index_requests(json_requests)
+        if "" not in self.page_requests:
+            json_requests = filter_requests(wait_for_request(self.driver, self.target_url,
+                                                             self.response_content_type,
+                                                             self.check_request_data, ""),
+                                            self.response_content_type)
+            self.index_requests(json_requests)
+        self.captured_requests = []
         del self.driver.requests
 
-        if not self.json_requests:
+        if not json_requests and not self.page_requests:
             raise ValueError(f"User '{self.username}' not found.")
 
     def extract_data(self) -> bool:
-        """Get posts data.
+        """Get posts data. The posts are extracted right away page by page, only
+        the paging information of the page is kept for loading the next page.
 
         Returns:
             bool: True if the posts data is found, False otherwise.
         """
-        after = self.json_data_list[-1]['page_info']["end_cursor"] if self.json_data_list else ""
-        idx = search_request(self.json_requests, self.target_url,
-                             self.response_content_type,
-                             self.check_request_data, after)
-        if idx is None:
+        after = self.page_info["end_cursor"] if self.page_info else ""
+        request = self.page_requests.pop(after, None)
+        if request is None:
             return False
+        self.cursor = after
 
-        request = self.json_requests.pop(idx)
         json_data = get_json_data(request.response)["data"][self.json_data_key]
-        self.json_data_list.append(json_data)
+        self.page_info = json_data["page_info"]
+        for item in json_data["edges"][:self.remaining]:
+            for k in self.access_keys:
+                item = item.get(k)
+            self.posts.append(extract_post(item))
         self.remaining -= len(json_data["edges"])
         return True
 
@@ -259,15 +456,19 @@ class CollectPostsBase(UserIDRequiredCollect):
         Returns:
             bool: True if continue fetching data, False otherwise.
         """
-        return self.json_data_list[-1]['page_info']["has_next_page"] and self.remaining > 0
+        # without a new cursor the next page can't be requested, scrolling
+        # would only wait for a response that never comes
+        end_cursor = self.page_info.get("end_cursor")
+        if not end_cursor or end_cursor == self.cursor:
+            return False
+        return self.page_info["has_next_page"] and self.remaining > 0
 
     def fetch_more_data(self) -> None:
         """Loading action."""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(random.SystemRandom().randint(4, 6))
-
-        self.json_requests += filter_requests(self.driver.requests,
-                                              self.response_content_type)
+        requests = wait_for_request(self.driver, self.target_url, self.response_content_type,
+                                    self.check_request_data, self.page_info["end_cursor"])
+        self.index_requests(filter_requests(requests, self.response_content_type))
         del self.driver.requests
 
     def generate_result(self, empty_result: bool = False) -> Json:
@@ -280,17 +481,9 @@ class CollectPostsBase(UserIDRequiredCollect):
             List[Dict[str, Any]]: The list of posts.
         """
         if empty_result:
-            return Posts(posts=[], count=0).model_dump(mode="json")
-        posts = []
-        for result in self.json_data_list:
-            for item in result['edges']:
-                for k in self.access_keys:
-                    item = item.get(k)
-                item_dict = item
-                post = extract_post(item_dict)
-                posts.append(post)
-        posts = posts[:self.n]
-        return Posts(posts=posts, count=len(posts)).model_dump(mode="json")
+            return get_default_result(Posts)
+        # the posts are validated already, no need to validate them again in the envelope
+        return Posts.model_construct(posts=self.posts, count=len(self.posts)).model_dump(mode="json")
 
     def collect(self) -> Json:
         """Collect posts.
@@ -307,6 +500,8 @@ class CollectPostsBase(UserIDRequiredCollect):
 
         if is_private_account:
             logger.warning(f"User '{self.username}' has a private account.")
+            # the account may become visible to the viewer, e.g. after following it
+            skip_caching()
             return self.generate_result(empty_result=True)
 
         self.fetch_data()
@@ -316,14 +511,11 @@ class CollectPostsBase(UserIDRequiredCollect):
         if not status:
             self.no_data_found = True
             logger.warning(f"No {self.collect_type} found for user '{self.username}'.")
+            skip_caching()
             return self.generate_result(empty_result=True)  # type: ignore
 
-        while self.continue_fetching():
-            self.fetch_more_data()
-            status = self.extract_data()
-            if not status:
-                break
-
+        if not self.paginate():
+            skip_caching()
         return self.generate_result(empty_result=False)
 
 
@@ -337,11 +529,19 @@ class CollectUsersBase(UserIDRequiredCollect):
         url (str): The URL to load.
         target_url_format (str): The target URL format to search for.
         collect_type (str): The type of data to collect.
-        json_data_list (List[Dict[str, Any]]): The list of json data.
+        users (List[UserProfile]): The users extracted so far.
+        next_max_id (Optional[str]): The cursor of the next page, None if there is no next page.
         remaining (int): The remaining number of users to collect.
-        json_requests (List[Dict[str, Any]]): The list of json requests.
+        page_requests (Dict[str, Request]): The captured requests of the pages, keyed by their urls.
         fetch_data_btn_xpath (str): The xpath of the initial load data button.
+        extra_query_str (str): The encoded query parameters of the target URL
+         besides `count` and `max_id`, prefixed with `&`.
+        target_url_prefix (Optional[str]): The target URL up to the cursor, built
+         once the user id is known.
+        dialog_bottom (Optional[WebElement]): The bottom of the users dialog, which
+         is scrolled into view to load more users.
     """
+    reuse_shown_profile = True
 
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
@@ -350,7 +550,8 @@ class CollectUsersBase(UserIDRequiredCollect):
                  url: str,
                  target_url_format: str,
                  collect_type: str,
-                 fetch_data_btn_xpath: str) -> None:
+                 fetch_data_btn_xpath: str,
+                 extra_query_dict: Optional[Dict[str, Any]] = None) -> None:
         """Initialize CollectPostsBase.
 
         Args:
@@ -361,6 +562,8 @@ class CollectUsersBase(UserIDRequiredCollect):
             target_url_format (str): The target URL format to search for.
             collect_type (str): The type of data to collect.
             fetch_data_btn_xpath (str): The xpath of the initial load data button.
+            extra_query_dict (Optional[Dict[str, Any]]): The query parameters of the
+             target URL besides `count` and `max_id`.
 
         Raises:
             ValueError: If the number of users to collect is not a positive integer.
@@ -372,52 +575,69 @@ class CollectUsersBase(UserIDRequiredCollect):
         self.n = n
         self.target_url_format = target_url_format
         self.collect_type = collect_type
-        self.json_data_list: List[Dict[str, Any]] = []
+        self.users: List[UserProfile] = []
+        self.next_max_id: Optional[str] = None
         self.remaining = n
-        self.json_requests: List[Request] = []
+        self.page_requests: Dict[str, Request] = {}
         self.fetch_data_btn_xpath = fetch_data_btn_xpath
+        self.extra_query_str = f"&{urlencode(extra_query_dict, quote_via=quote)}" if extra_query_dict else ""
+        self.target_url_prefix: Optional[str] = None
+        self.dialog_bottom: Optional[WebElement] = None
 
     def fetch_data(self) -> None:
         """Initial load data."""
         followers_btn = self.driver.find_element(By.XPATH, self.fetch_data_btn_xpath)
         followers_btn.click()
-        time.sleep(random.SystemRandom().randint(4, 6))
-        self.json_requests += filter_requests(self.driver.requests)
+        self.index_requests(wait_for_request(self.driver, self.get_target_url()))
         del self.driver.requests
 
-    def get_request_query_dict(self) -> Dict[str, Any]:
-        """Get request query dict."""
-        raise NotImplementedError
+    def index_requests(self, requests: List[Request]) -> None:
+        """Index the json requests by their urls, the url of a page contains its
+        cursor. A page is then looked up directly by its url instead of scanning
+        all the requests captured so far.
+
+        Args:
+            requests (List[Request]): The newly captured requests.
+        """
+        for request in filter_requests(requests):
+            # the first captured request of a page is used, same as `search_request`
+            self.page_requests.setdefault(request.url, request)
 
     def get_target_url(self) -> str:
-        """Get target URL.
+        """Get target URL. Only the cursor changes from page to page, the rest of
+        the URL is built once.
 
         Returns:
             str: The target URL.
         """
-        query_dict = self.get_request_query_dict()
-        query_str = urlencode(query_dict, quote_via=quote)
-        target_url = self.target_url_format.format(user_id=self.user_id,
-                                                   query_str=query_str)
-        return target_url
+        if self.target_url_prefix is None:
+            self.target_url_prefix = self.target_url_format.format(user_id=self.user_id,
+                                                                   query_str="count=12")
+        target_url = self.target_url_prefix
+        if self.next_max_id is not None:
+            target_url += f"&max_id={quote(str(self.next_max_id), safe='')}"
+        return target_url + self.extra_query_str
 
     def extract_data(self) -> bool:
-        """Get posts data.
+        """Get users data. The users are extracted right away page by page, the
+        users beyond the requested number are skipped.
 
         Returns:
-            bool: True if the posts data is found, False otherwise.
+            bool: True if the users data is found, False otherwise.
         """
-        target_url = self.get_target_url()
-        idx = search_request(self.json_requests, target_url,
-                             JsonResponseContentType.application_json)
-
-        if idx is None:
+        request = self.page_requests.pop(self.get_target_url(), None)
+        if request is None:
             return False
 
-        request = self.json_requests.pop(idx)
         json_data = get_json_data(request.response)
-        self.json_data_list.append(json_data)
+        self.users += create_users_list([json_data], "users", self.remaining)
         self.remaining -= len(json_data["users"])
+        next_max_id = json_data.get("next_max_id")
+        # a repeated cursor would request the same page again, and after an
+        # empty page no further users are expected
+        if next_max_id == self.next_max_id or not json_data["users"]:
+            next_max_id = None
+        self.next_max_id = next_max_id
         return True
 
     def continue_fetching(self) -> bool:
@@ -426,14 +646,19 @@ class CollectUsersBase(UserIDRequiredCollect):
         Returns:
             bool: True if continue fetching data, False otherwise.
         """
-        return 'next_max_id' in self.json_data_list[-1] and self.remaining > 0
+        return self.next_max_id is not None and self.remaining > 0
 
     def fetch_more_data(self) -> None:
         """Loading action."""
-        followers_bottom = self.driver.find_element(By.XPATH, "//div[@class='_aano']//div[@role='progressbar']")
-        self.driver.execute_script("return arguments[0].scrollIntoView(true);", followers_bottom)
-        time.sleep(random.SystemRandom().randint(4, 6))
-        self.json_requests += filter_requests(self.driver.requests)
+        # the bottom of the dialog is looked up once and only again after it's re-rendered
+        if self.dialog_bottom is None:
+            self.dialog_bottom = self.driver.find_element(By.XPATH, USERS_DIALOG_BOTTOM_XPATH)
+        try:
+            self.driver.execute_script("return arguments[0].scrollIntoView(true);", self.dialog_bottom)
+        except StaleElementReferenceException:
+            self.dialog_bottom = self.driver.find_element(By.XPATH, USERS_DIALOG_BOTTOM_XPATH)
+            self.driver.execute_script("return arguments[0].scrollIntoView(true);", self.dialog_bottom)
+        self.index_requests(wait_for_request(self.driver, self.get_target_url()))
         del self.driver.requests
 
     def generate_result(self, empty_result: bool = False) -> Json:
@@ -446,19 +671,8 @@ class CollectUsersBase(UserIDRequiredCollect):
             List[UserProfile]: The list of users.
         """
         if empty_result:
-            return Users(users=[], count=0).model_dump(mode="json")
-        users = []
-        for json_data in self.json_data_list:
-            for user_info in json_data["users"]:
-                user = UserProfile(id=extract_id(user_info),
-                                   username=user_info.get("username", ""),
-                                   fullname=user_info.get("full_name", ""),
-                                   profile_pic_url=user_info.get("profile_pic_url", ""),
-                                   is_private=user_info.get("is_private"),
-                                   is_verified=user_info.get("is_verified"))
-                users.append(user)
-        users = users[:self.n]
-        return Users(users=users, count=len(users)).model_dump(mode="json")
+            return get_default_result(Users)
+        return Users.model_construct(users=self.users, count=len(self.users)).model_dump(mode="json")
 
     def collect(self) -> Json:
         """Collect users.
@@ -472,6 +686,8 @@ class CollectUsersBase(UserIDRequiredCollect):
 
         if is_private_account:
             logger.warning(f"User '{self.username}' has a private account.")
+            # the account may become visible to the viewer, e.g. after following it
+            skip_caching()
             return self.generate_result(empty_result=True)
 
         self.fetch_data()
@@ -480,14 +696,11 @@ class CollectUsersBase(UserIDRequiredCollect):
         status = self.extract_data()
         if not status:
             logger.warning(f"No {self.collect_type} found for user '{self.username}'.")
+            skip_caching()
             return self.generate_result(empty_result=True)
 
-        while self.continue_fetching():
-            self.fetch_more_data()
-            status = self.extract_data()
-            if not status:
-                break
-
+        if not self.paginate():
+            skip_caching()
         return self.generate_result(empty_result=False)
 
 
@@ -533,13 +746,17 @@ class CollectPostInfoBase(CollectBase):
         self.json_data_list: List[Dict[str, Any]] = []
         self.remaining = n
         self.json_requests: List[Request] = []
-        self.post_id = None
+        self.post_id: Optional[str] = None
+
+    def wait_for_webpage(self) -> None:
+        """Nothing to wait for, the implicit wait of the driver waits for the post
+        to be shown, and the responses are waited for right before reading them."""
+        pass
 
     def get_post_id(self) -> None:
         """Get the post id."""
-        meta_tag_xpath = "//meta[@property='al:ios:url']"
-        meta_tag = self.driver.find_element(By.XPATH, meta_tag_xpath)
-        post_ids = re.findall("\d+", meta_tag.get_attribute("content"))  # noqa
-        if not post_ids:
+        meta_tag = self.driver.find_element(By.CSS_SELECTOR, POST_ID_META_CSS_SELECTOR)
+        match = _POST_ID_RE.search(meta_tag.get_attribute("content"))
+        if not match:
             return
-        self.post_id = post_ids[0]
+        self.post_id = match.group(1)
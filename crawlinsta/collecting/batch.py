@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from pydantic import Json
+from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
+from typing import Union, List, Sequence, Callable, Any
+
+
+def collect_in_parallel(drivers: Sequence[Union[Chrome, Edge, Firefox, Safari, Remote]],
+                        collect_func: Callable[..., Any],
+                        targets: Sequence[Any],
+                        *args, **kwargs) -> List[Json]:
+    """Run the given collecting function for each target, distributing the
+    targets over the given drivers, so that the targets are collected concurrently.
+
+    A single driver can only control one browser page at a time, therefore each
+    driver is used by at most one job at once. The jobs are run in a thread pool
+    with one worker per driver, and a driver is handed back to the pool as soon as
+    its job is done. Most of the time of a job is spent in waiting for the browser,
+    which makes the collecting speed up nearly linearly with the number of drivers.
+
+    Args:
+        drivers (Sequence[Union[Chrome, Edge, Firefox, Safari, Remote]]): logged in
+         selenium drivers, each one of them is used by one job at a time.
+        collect_func (Callable[..., Any]): collecting function, which takes a driver as first
+         argument and a target as second argument, e.g. `collect_user_info`.
+        targets (Sequence[Any]): targets to collect, e.g. a list of usernames.
+        *args: additional positional arguments passed to the collecting function.
+        **kwargs: additional keyword arguments passed to the collecting function.
+
+    Returns:
+        List[Json]: the results of the collecting function, in the same order as the targets.
+
+    Raises:
+        ValueError: if no driver is given.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> from crawlinsta.login import login_with_cookies
+        >>> from crawlinsta.collecting import collect_user_info, collect_in_parallel
+        >>> drivers = [webdriver.Chrome('path_to_chromedriver') for _ in range(2)]
+        >>> for driver in drivers:
+        ...     login_with_cookies(driver)
+        >>> collect_in_parallel(drivers, collect_user_info, ["instagram_username1", "instagram_username2"])
+        [
+          {
+            "id": "1234567890",
+            "username": "instagram_username1",
+            ...
+          },
+          {
+            "id": "1234567891",
+            "username": "instagram_username2",
+            ...
+          }
+        ]
+    """
+    if not drivers:
+        raise ValueError("At least one driver is required for collecting in parallel.")
+
+    available_drivers: Queue = Queue()
+    for driver in drivers:
+        available_drivers.put(driver)
+
+    def collect_target(target: Any) -> Json:
+        driver = available_drivers.get()
+        try:
+            return collect_func(driver, target, *args, **kwargs)
+        finally:
+            available_drivers.put(driver)
+
+    with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+        return list(executor.map(collect_target, targets))
@@ -1,22 +1,26 @@
 import json
 import logging
-import random
-import time
-from urllib.parse import parse_qs
 from pydantic import Json
 from seleniumwire.request import Request
-from selenium.webdriver.common.by import By
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Optional
 from ..schemas import UserBasicInfo, Comment, Comments
-from ..utils import search_request, get_json_data, filter_requests, find_brackets
-from ..decorators import driver_implicit_wait
+from ..utils import (
+    search_request, get_json_data, filter_requests, get_default_result, wait_for_request, get_request_data
+)
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache, skip_caching
 from ..data_extraction import extract_id
-from ..constants import INSTAGRAM_DOMAIN, GRAPHQL_QUERY_PATH, JsonResponseContentType
+from ..constants import (
+    INSTAGRAM_DOMAIN, JsonResponseContentType, GRAPHQL_API_URL, GRAPHQL_QUERY_URL, API_CAPTURE_SCOPES,
+    VIEWER_ID, VIEWER_ID_FORM_FIELD,
+    COMMENT_LINKS_CSS_SELECTOR_FORMAT, FIND_JSON_SCRIPT_JS, SCROLL_LAST_INTO_VIEW_JS
+)
 from .base import CollectPostInfoBase
 
 logger = logging.getLogger("crawlinsta")
 
+_JSON_DECODER = json.JSONDecoder()
+
 
 class CollectCommentOfPost(CollectPostInfoBase):
     """Base class for collecting comments of a post.
@@ -28,7 +32,10 @@ class CollectCommentOfPost(CollectPostInfoBase):
         url (str): The URL of the post.
         target_url (str): The target URL to search for.
         collect_type (str): The type of data to collect.
-        json_data_list (List[Dict[str, Any]]): The list of json data.
+        comments (List[Comment]): The comments extracted so far.
+        page_info (Dict[str, Any]): The paging information of the last extracted page.
+        previous_end_cursor (Optional[str]): The end cursor of the page before the last extracted page.
+        comment_links_css_selector (str): The css selector of the permalinks of the shown comments.
         json_requests (List[Dict[str, Any]]): The list of json requests.
         remaining (int): The remaining number of comments to collect.
         post_id (str): The post id.
@@ -54,6 +61,10 @@ class CollectCommentOfPost(CollectPostInfoBase):
         self.cannot_load = False
         self.target_url = target_url
         self.json_response_content_type = json_response_content_type
+        self.comments: List[Comment] = []
+        self.page_info: Dict[str, Any] = {}
+        self.previous_end_cursor: Optional[str] = None
+        self.comment_links_css_selector = COMMENT_LINKS_CSS_SELECTOR_FORMAT.format(post_code=post_code)
 
     def check_request_data(self, request: Request) -> bool:
         """Check the request data.
@@ -64,9 +75,11 @@ class CollectCommentOfPost(CollectPostInfoBase):
         Returns:
             bool: True if the request data is valid, otherwise False.
         """
-        request_data = parse_qs(request.body.decode())
-        variables = json.loads(request_data.get("variables", ["{}"])[0])
-        if request_data.get("av", [''])[0] != "17841461911219001":
+        # cheap check on the raw body before parsing it
+        if VIEWER_ID_FORM_FIELD not in request.body:
+            return False
+        request_data, variables = get_request_data(request)
+        if request_data.get("av", [''])[0] != VIEWER_ID:
             return False
         elif not variables:
             return False
@@ -74,35 +87,32 @@ class CollectCommentOfPost(CollectPostInfoBase):
             return False
         return True
 
-    def find_cached_data(self) -> List[Dict[str, Any]]:
+    def find_cached_data(self) -> Dict[str, Any]:
         """Find the cached data.
 
         Returns:
             Dict[str, Any]: The cached data.
         """
-        scripts = self.driver.find_elements(By.XPATH, '//script[@type="application/json"]')
-        script_data = None
-        for script in scripts:
-            if "xdt_api__v1__media__media_id__comments__connection" not in script.get_attribute("innerHTML"):
-                continue
-            script_data = script
-            break
-
-        if not script_data:
-            return []
-
-        data_str = script_data.get_attribute("innerHTML")
+        # the script tags are searched in the browser, instead of reading
+        # the content of each one of them with a separate WebDriver command
+        data_str = self.driver.execute_script(FIND_JSON_SCRIPT_JS,
+                                              "xdt_api__v1__media__media_id__comments__connection")
+        if not data_str:
+            return {}
+
         start_idx = data_str.find("xdt_api__v1__media__media_id__comments__connection")
         offset = len("xdt_api__v1__media__media_id__comments__connection")
-        start_idx += offset
-        data_str = data_str[start_idx:]
-        start, stop = find_brackets(data_str)[-1]
-        json_data = json.loads(data_str[start:stop + 1])
+        start_idx = data_str.find("{", start_idx + offset)
+        # the object is parsed right where it starts, the decoder stops at its end,
+        # so the rest of the script doesn't need to be scanned for the closing bracket
+        json_data, _ = _JSON_DECODER.raw_decode(data_str, start_idx)
         return json_data
 
     def fetch_data(self) -> None:
         """Fetching data."""
-        self.json_requests = filter_requests(self.driver.requests,
+        self.json_requests = filter_requests(wait_for_request(self.driver, self.target_url,
+                                                              self.json_response_content_type,
+                                                              self.check_request_data),
                                              self.json_response_content_type)
         del self.driver.requests
 
@@ -120,29 +130,62 @@ class CollectCommentOfPost(CollectPostInfoBase):
             return False
 
         request = self.json_requests.pop(idx)
+        # the requests are kept in the order they were captured, the ones before the
+        # page can't be a following page, so they aren't searched through again
+        del self.json_requests[:idx]
         json_data = get_json_data(request.response)["data"]["xdt_api__v1__media__media_id__comments__connection"]
-        self.json_data_list.append(json_data)
-        self.remaining -= len(json_data["edges"])
+        self.add_page(json_data)
         return True
 
+    def add_page(self, json_data: Dict[str, Any]) -> None:
+        """Extract the comments of a page right away, only the paging information
+        of the page is kept for loading the next page.
+
+        Args:
+            json_data (Dict[str, Any]): The json data of the page.
+        """
+        for item in json_data["edges"][:self.remaining]:
+            comment_dict = item["node"]
+            default_created_at_timestamp = comment_dict.get("created_at", 0)
+            comment = Comment(id=extract_id(comment_dict),
+                              user=UserBasicInfo(id=extract_id(comment_dict["user"]),
+                                                 username=comment_dict["user"]["username"]),
+                              post_id=self.post_id,  # type: ignore
+                              created_at_utc=comment_dict.get("created_at_utc", default_created_at_timestamp),
+                              status=comment_dict.get("status"),
+                              share_enabled=comment_dict.get("share_enabled"),
+                              is_ranked_comment=comment_dict.get("is_ranked_comment"),
+                              text=comment_dict["text"],
+                              has_translation=comment_dict.get("has_translation", False),
+                              is_liked_by_post_owner=comment_dict.get("has_liked_comment", False),
+                              comment_like_count=comment_dict.get("comment_like_count", 0))
+            self.comments.append(comment)
+        self.remaining -= len(json_data["edges"])
+        if self.page_info:
+            self.previous_end_cursor = self.page_info.get("end_cursor")
+        self.page_info = json_data["page_info"]
+
     def continue_fetching(self) -> bool:
         """Check if the fetching should continue.
 
         Returns:
             bool: True if the fetching should continue, otherwise False.
         """
-        return self.json_data_list[-1]["page_info"]['has_next_page'] and self.remaining > 0
+        # without a new cursor the next page can't be requested, scrolling
+        # would only wait for a response that never comes
+        end_cursor = self.page_info.get("end_cursor")
+        if not end_cursor or end_cursor == self.previous_end_cursor:
+            return False
+        return self.page_info['has_next_page'] and self.remaining > 0
 
     def fetch_more_data(self) -> None:
         """Loading action."""
-        xpath = '//div[@class="x78zum5 xdt5ytf x1iyjqo2"]/div[@class="x9f619 xjbqb8w x78zum5 x168nmei x13lgxp2 ' \
-                'x5pf9jr xo71vjh x1uhb9sk x1plvlek xryxfnj x1c4vz4f x2lah0s xdt5ytf xqjyukv x1qjc9v5 x1oa3qoh ' \
-                'x1nhvcw1"]'
-        comment_lists = self.driver.find_elements(By.XPATH, xpath)
-        self.driver.execute_script("return arguments[0].scrollIntoView(true);", comment_lists[-1])
-
-        time.sleep(random.SystemRandom().randint(4, 6))
-        self.json_requests += filter_requests(self.driver.requests,
+        # scrolling the last shown comment into view loads the next comments
+        self.driver.execute_script(SCROLL_LAST_INTO_VIEW_JS, self.comment_links_css_selector)
+        # the requests of the shown pages are deleted, any new matching request is of the next page
+        self.json_requests += filter_requests(wait_for_request(self.driver, self.target_url,
+                                                               self.json_response_content_type,
+                                                               self.check_request_data),
                                               self.json_response_content_type)
         del self.driver.requests
 
@@ -156,27 +199,8 @@ class CollectCommentOfPost(CollectPostInfoBase):
             Json: The generated result in json format.
         """
         if empty_result:
-            return Comments(comments=[], count=0).model_dump(mode="json")
-        comments = []
-        for json_data in self.json_data_list:
-            for item in json_data["edges"]:
-                comment_dict = item["node"]
-                default_created_at_timestamp = comment_dict.get("created_at", 0)
-                comment = Comment(id=extract_id(comment_dict),
-                                  user=UserBasicInfo(id=extract_id(comment_dict["user"]),
-                                                     username=comment_dict["user"]["username"]),
-                                  post_id=self.post_id,  # type: ignore
-                                  created_at_utc=comment_dict.get("created_at_utc", default_created_at_timestamp),
-                                  status=comment_dict.get("status"),
-                                  share_enabled=comment_dict.get("share_enabled"),
-                                  is_ranked_comment=comment_dict.get("is_ranked_comment"),
-                                  text=comment_dict["text"],
-                                  has_translation=comment_dict.get("has_translation", False),
-                                  is_liked_by_post_owner=comment_dict.get("has_liked_comment", False),
-                                  comment_like_count=comment_dict.get("comment_like_count", 0))
-                comments.append(comment)
-        comments = comments[:self.n]
-        return Comments(comments=comments, count=len(comments)).model_dump(mode="json")
+            return get_default_result(Comments)
+        return Comments.model_construct(comments=self.comments, count=len(self.comments)).model_dump(mode="json")
 
     def collect(self) -> Json:
         """Collect comments of a post.
@@ -190,13 +214,13 @@ class CollectCommentOfPost(CollectPostInfoBase):
         self.get_post_id()
         if not self.post_id:
             logger.warning(f"No post id found for post '{self.post_code}'.")
+            skip_caching()
             return self.generate_result(True)
 
         cached_data = self.find_cached_data()
 
         if cached_data:
-            self.json_data_list.append(cached_data)
-            self.remaining -= len(cached_data["edges"])
+            self.add_page(cached_data)
         else:
             self.fetch_data()
 
@@ -204,24 +228,24 @@ class CollectCommentOfPost(CollectPostInfoBase):
             if not status:
                 logger.warning(f"No comments found for post '{self.post_code}'.")
                 self.cannot_load = True
+                skip_caching()
                 return self.generate_result(True)
 
-        while self.continue_fetching():
-            self.fetch_more_data()
-
-            status = self.extract_data()
-            if not status:
-                self.cannot_load = True
-                break
-
+        if not self.paginate():
+            self.cannot_load = True
+            skip_caching()
         return self.generate_result(False)
 
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_comments_of_post(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                              post_code: str,
                              n: int = 100) -> Json:
     """Collect n comments of a given post.
+    The result is cached for 5 minutes, use `collect_comments_of_post.invalidate(post_code)`
+    to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
@@ -269,9 +293,9 @@ def collect_comments_of_post(driver: Union[Chrome, Edge, Firefox, Safari, Remote
         }
     """
     target_responses = [
-        dict(url=f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}",
+        dict(url=GRAPHQL_QUERY_URL,
              content_type=JsonResponseContentType.application_json),
-        dict(url=f"{INSTAGRAM_DOMAIN}/api/graphql",
+        dict(url=GRAPHQL_API_URL,
              content_type=JsonResponseContentType.text_javascript), ]
     results = []
     for response in target_responses:
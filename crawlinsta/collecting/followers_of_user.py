@@ -1,9 +1,9 @@
 import logging
 from pydantic import Json
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union, Dict, Any
-from ..decorators import driver_implicit_wait
-from ..constants import INSTAGRAM_DOMAIN, API_VERSION
+from typing import Union
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache
+from ..constants import INSTAGRAM_DOMAIN, FOLLOWERS_URL_FORMAT, FOLLOWERS_BTN_XPATH_FORMAT, API_CAPTURE_SCOPES
 from .base import CollectUsersBase
 
 logger = logging.getLogger("crawlinsta")
@@ -18,9 +18,10 @@ class CollectFollowersOfUser(CollectUsersBase):
         n (int): The number of users to collect.
         target_url_format (str): The target URL format to search for.
         collect_type (str): The type of data to collect.
-        json_data_list (List[Dict[str, Any]]): The list of json data.
+        users (List[UserProfile]): The users extracted so far.
+        next_max_id (Optional[str]): The cursor of the next page, None if there is no next page.
         remaining (int): The remaining number of users to collect.
-        json_requests (List[Dict[str, Any]]): The list of json requests.
+        page_requests (Dict[str, Request]): The captured requests of the pages, keyed by their urls.
         fetch_data_btn_xpath (str): The xpath of the initial load data button.
     """
     def __init__(self,
@@ -34,31 +35,25 @@ class CollectFollowersOfUser(CollectUsersBase):
             username (str): The username of the user.
             n (int): The number of users to collect.
         """
-        target_url_format = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/" + "{user_id}/followers/?{query_str}"
+        target_url_format = FOLLOWERS_URL_FORMAT
         collect_type = "followers"
-        initial_load_data_btn_xpath = f"//a[@href='/{username}/followers/'][@role='link']"
+        initial_load_data_btn_xpath = FOLLOWERS_BTN_XPATH_FORMAT.format(username=username)
         super().__init__(driver, username, n, f'{INSTAGRAM_DOMAIN}/{username}/',
-                         target_url_format, collect_type, initial_load_data_btn_xpath)
-
-    def get_request_query_dict(self) -> Dict[str, Any]:
-        """Get request query dict.
-
-        Returns:
-            Dict[str, Any]: The request query dictionary.
-        """
-        if not self.json_data_list:
-            return dict(count=12, search_surface="follow_list_page")
-        return dict(count=12, max_id=self.json_data_list[-1]['next_max_id'],
-                    search_surface="follow_list_page")
+                         target_url_format, collect_type, initial_load_data_btn_xpath,
+                         dict(search_surface="follow_list_page"))
 
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_followers_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                               username: str,
                               n: int = 100) -> Json:
     """Collect n followers of the given user. This action depends on the account privacy.
     if the account user limites the visibility of the followers, only the account owner can
     view all followers and anyone besides the account owner can get maximal 50 followers.
+    The result is cached for 5 minutes, use `collect_followers_of_user.invalidate(username)`
+    to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
@@ -1,7 +1,5 @@
 import json
 import logging
-import random
-import time
 from urllib.parse import quote, urlencode
 from pydantic import Json
 from selenium.webdriver.common.by import By
@@ -9,10 +7,13 @@ from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
 from typing import Union, List, Dict, Any
 from ..schemas import HashtagBasicInfo, HashtagBasicInfos
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
+from ..utils import search_request, get_json_data, filter_requests, get_default_result, wait_for_request
+from ..decorators import driver_implicit_wait, driver_capture_scopes
 from ..data_extraction import extract_id
-from ..constants import INSTAGRAM_DOMAIN, GRAPHQL_QUERY_PATH, FOLLOWING_DOC_ID, JsonResponseContentType
+from ..constants import (
+    INSTAGRAM_DOMAIN, FOLLOWING_DOC_ID, JsonResponseContentType, GRAPHQL_QUERY_URL, API_CAPTURE_SCOPES,
+    FOLLOWING_BTN_XPATH_FORMAT, HASHTAGS_TAB_XPATH
+)
 from .base import UserIDRequiredCollect
 
 logger = logging.getLogger("crawlinsta")
@@ -28,6 +29,8 @@ class CollectFollowingHashtagsOfUser(UserIDRequiredCollect):
         n (int): maximum number of followings, which should be collected.
          By default, it's 100. If it's set to 0, collect all followings.
     """
+    reuse_shown_profile = True
+
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                  username: str,
@@ -61,7 +64,7 @@ class CollectFollowingHashtagsOfUser(UserIDRequiredCollect):
         variables = dict(id=self.user_id)
         query_dict = dict(doc_id=FOLLOWING_DOC_ID,
                           variables=json.dumps(variables, separators=(',', ':')))
-        target_url = f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}/?{urlencode(query_dict, quote_via=quote)}"
+        target_url = f"{GRAPHQL_QUERY_URL}/?{urlencode(query_dict, quote_via=quote)}"
         return target_url
 
     def extract_data(self) -> bool:
@@ -83,16 +86,15 @@ class CollectFollowingHashtagsOfUser(UserIDRequiredCollect):
 
     def fetch_data(self) -> None:
         """Loading action."""
-        following_btn_xpath = f"//a[@href='/{self.username}/following/'][@role='link']"
+        following_btn_xpath = FOLLOWING_BTN_XPATH_FORMAT.format(username=self.username)
         following_btn = self.driver.find_element(By.XPATH, following_btn_xpath)
         following_btn.click()
-        time.sleep(random.SystemRandom().randint(3, 5))
 
-        hashtag_btn = self.driver.find_element(By.XPATH, "//span[text()='Hashtags']")
+        # the implicit wait of the driver waits for the dialog to show the tab
+        hashtag_btn = self.driver.find_element(By.XPATH, HASHTAGS_TAB_XPATH)
         hashtag_btn.click()
-        time.sleep(random.SystemRandom().randint(4, 6))
 
-        self.json_requests += filter_requests(self.driver.requests,
+        self.json_requests += filter_requests(wait_for_request(self.driver, self.get_target_url()),
                                               JsonResponseContentType.application_json)
         del self.driver.requests
 
@@ -107,7 +109,7 @@ class CollectFollowingHashtagsOfUser(UserIDRequiredCollect):
             json format.
         """
         if empty_result:
-            return HashtagBasicInfos(hashtags=[], count=0).model_dump(mode="json")
+            return get_default_result(HashtagBasicInfos)
         hashtags = []
         for json_data in self.json_data_list:
             for item in json_data["data"]['user']['edge_following_hashtag']['edges']:
@@ -117,7 +119,7 @@ class CollectFollowingHashtagsOfUser(UserIDRequiredCollect):
                                            profile_pic_url=item["node"]["profile_pic_url"])
                 hashtags.append(hashtag)
         hashtags = hashtags[:self.n]
-        return HashtagBasicInfos(hashtags=hashtags, count=len(hashtags)).model_dump(mode="json")
+        return HashtagBasicInfos.model_construct(hashtags=hashtags, count=len(hashtags)).model_dump(mode="json")
 
     def collect(self) -> Json:
         """Collect posts data of the given user.
@@ -146,6 +148,7 @@ class CollectFollowingHashtagsOfUser(UserIDRequiredCollect):
 
 
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_following_hashtags_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                                        username: str,
                                        n: int = 100) -> Json:
@@ -1,9 +1,9 @@
 import logging
 from pydantic import Json
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union, Dict, Any
-from ..decorators import driver_implicit_wait
-from ..constants import INSTAGRAM_DOMAIN, API_VERSION
+from typing import Union
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache
+from ..constants import INSTAGRAM_DOMAIN, FOLLOWING_URL_FORMAT, FOLLOWING_BTN_XPATH_FORMAT, API_CAPTURE_SCOPES
 from .base import CollectUsersBase
 
 logger = logging.getLogger("crawlinsta")
@@ -32,27 +32,20 @@ class CollectFollowingsOfUser(CollectUsersBase):
             n (int): maximum number of followings, which should be collected. By default,
              it's 100. If it's set to 0, collect all followings.
         """
-        target_url_format = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/" + "{user_id}/following/?{query_str}"
-        fetch_data_btn_xpath = f"//a[@href='/{username}/following/'][@role='link']"
+        target_url_format = FOLLOWING_URL_FORMAT
+        fetch_data_btn_xpath = FOLLOWING_BTN_XPATH_FORMAT.format(username=username)
         url = f'{INSTAGRAM_DOMAIN}/{username}/'
         super().__init__(driver, username, n, url, target_url_format, "followings", fetch_data_btn_xpath)
 
-    def get_request_query_dict(self) -> Dict[str, Any]:
-        """Get request query dict.
-
-        Returns:
-            Dict[str, Any]: request query dict.
-        """
-        if not self.json_data_list:
-            return dict(count=12)
-        return dict(count=12, max_id=self.json_data_list[-1]['next_max_id'])
-
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_followings_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                                username: str,
                                n: int = 100) -> Json:
-    """Collect n followings of the given user.
+    """Collect n followings of the given user. The result is cached for 5 minutes,
+    use `collect_followings_of_user.invalidate(username)` to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
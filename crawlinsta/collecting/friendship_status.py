@@ -1,23 +1,28 @@
 import logging
-import random
-import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote, urlencode
 from pydantic import Json
 from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
 from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union, List, Dict, Any
+from typing import Union, List, Dict, Any, Sequence, Optional, Type, Callable, Tuple
 from ..schemas import FriendshipStatus
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
-from ..constants import INSTAGRAM_DOMAIN, API_VERSION, JsonResponseContentType
+from ..utils import search_request, get_json_data, filter_requests, wait_for_request, get_viewer_id
+from ..cache import TTLCache
+from ..decorators import driver_implicit_wait, driver_capture_scopes
+from ..constants import (
+    INSTAGRAM_DOMAIN, JsonResponseContentType, FOLLOWING_URL_FORMAT, FOLLOWERS_URL_FORMAT, API_CAPTURE_SCOPES,
+    FOLLOWING_BTN_XPATH_FORMAT, FOLLOWERS_BTN_XPATH_FORMAT, SEARCH_INPUT_XPATH
+)
 from .base import UserIDRequiredCollect
 
 logger = logging.getLogger("crawlinsta")
 
 
 class GetFriendshipStatus(UserIDRequiredCollect):
-    """Class for getting friendship status.
+    """Class for getting friendship status, searching the users in the followings
+    dialog of the user.
 
     Attributes:
         driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium
@@ -26,7 +31,14 @@ class GetFriendshipStatus(UserIDRequiredCollect):
         searching_username (str): username of the user to search for.
         json_requests (list): list of json requests.
         json_data (dict): json data.
+        users_type (str): the type of the users listed in the searched dialog.
+        dialog_btn_xpath_format (str): the xpath format of the button opening the dialog.
+        search_url_format (str): the url format of the searching request of the dialog.
     """
+    users_type: str = "followings"
+    dialog_btn_xpath_format: str = FOLLOWING_BTN_XPATH_FORMAT
+    search_url_format: str = FOLLOWING_URL_FORMAT
+
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                  username: str,
@@ -44,16 +56,23 @@ class GetFriendshipStatus(UserIDRequiredCollect):
         self.json_requests: List[Request] = []
         self.json_data: Union[Dict[str, Any], None] = None
 
-    def extract_data(self) -> bool:
-        """Extracting data from the json requests.
+    def get_target_url(self) -> str:
+        """Get the url of the request searching for the user with `searching_username`.
 
         Returns:
-            bool: True if the user is found in the followings of the user with
-            `username`, False otherwise.
+            str: url of the searching request.
         """
         query_dict = dict(query=self.searching_username)
         query_str = urlencode(query_dict, quote_via=quote)
-        target_url = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/{self.user_id}/following/?{query_str}"
+        return self.search_url_format.format(user_id=self.user_id, query_str=query_str)
+
+    def extract_data(self) -> bool:
+        """Extracting data from the json requests.
+
+        Returns:
+            bool: True if the searching request is found, False otherwise.
+        """
+        target_url = self.get_target_url()
         idx = search_request(self.json_requests, target_url,
                              JsonResponseContentType.application_json)
 
@@ -64,31 +83,61 @@ class GetFriendshipStatus(UserIDRequiredCollect):
         self.json_data = get_json_data(request.response)
         return True
 
-    def fetch_data(self) -> None:
-        """Loading action."""
-        following_btn = self.driver.find_element(By.XPATH, f"//a[@href='/{self.username}/following/'][@role='link']")
-        following_btn.click()
-        time.sleep(random.SystemRandom().randint(4, 6))
+    def open_search_box(self) -> None:
+        """Open the dialog of the user and locate its search input box."""
+        dialog_btn_xpath = self.dialog_btn_xpath_format.format(username=self.username)
+        dialog_btn = self.driver.find_element(By.XPATH, dialog_btn_xpath)
+        dialog_btn.click()
         del self.driver.requests
 
-        search_input_box = self.driver.find_element(
-            By.XPATH, '//input'
-                      '[@aria-label="Search input" or @aria-label="Sucheingabe"]'
-                      '[@placeholder="Search" or @placeholder="Suchen"]'
-                      '[@type="text"]')
-        search_input_box.send_keys(self.searching_username)
-        time.sleep(random.SystemRandom().randint(6, 8))
+        # the implicit wait of the driver waits for the dialog to show the search input box
+        self.search_input_box = self.driver.find_element(By.XPATH, SEARCH_INPUT_XPATH)
 
-        self.json_requests = filter_requests(self.driver.requests,
+    def fetch_data(self) -> None:
+        """Loading action, typing the searching username into the opened search input box."""
+        self.search_input_box.send_keys(self.searching_username)
+        self.json_requests = filter_requests(wait_for_request(self.driver, self.get_target_url()),
                                              JsonResponseContentType.application_json)
         del self.driver.requests
 
-    def collect(self) -> bool:
-        """Collect the friendship status between the user with `username` and the user with `searching_username`.
+    def search(self, searching_username: str) -> Optional[bool]:
+        """Search for the user with `searching_username` in the opened dialog.
+
+        Args:
+            searching_username (str): username of the user to search for.
 
         Returns:
-            bool: True if the user with `searching_username` is found in the followings of the user with `username`,
-            False otherwise.
+            Optional[bool]: True if the user with `searching_username` is found in the dialog of the user
+            with `username`, False otherwise, None if the searching request isn't captured.
+        """
+        if self.searching_username != searching_username:
+            # erase the previous search term key by key, so that the page notices the change
+            self.search_input_box.send_keys(Keys.BACKSPACE * len(self.searching_username))
+            self.searching_username = searching_username
+
+        self.fetch_data()
+        status = self.extract_data()
+        if not status:
+            logger.warning(f"Searching request for user '{self.searching_username}' in "
+                           f"{self.users_type} of user '{self.username}' not found.")
+            return None
+
+        # the search is filtered by instagram already, only the few matching users are returned
+        return any(user_info["username"] == self.searching_username
+                   for user_info in self.json_data["users"])  # type: ignore
+
+    def collect_many(self, searching_usernames: Sequence[str]) -> Dict[str, Optional[bool]]:
+        """Collect the friendship status between the user with `username` and each of
+        the users with `searching_usernames`, searching all of them in the same
+        dialog, so that the profile page is loaded only once.
+
+        Args:
+            searching_usernames (Sequence[str]): usernames of the users to search for.
+
+        Returns:
+            Dict[str, Optional[bool]]: for each of the `searching_usernames`, True if the user is
+            found in the dialog of the user with `username`, False otherwise, None if it
+            couldn't be searched, i.e. the account is private or the searching request isn't captured.
         """
         self.load_webpage()
 
@@ -98,26 +147,143 @@ class GetFriendshipStatus(UserIDRequiredCollect):
 
         if is_private_account:
             logger.warning(f"User '{self.username}' has a private account.")
-            return False
+            return {searching_username: None for searching_username in searching_usernames}
 
-        self.fetch_data()
-        status = self.extract_data()
-        if not status:
-            logger.warning(f"Searching request for user '{self.searching_username}' in "
-                           f"followings of user '{self.username}' not found.")
-            return False
+        self.open_search_box()
+        return {searching_username: self.search(searching_username)
+                for searching_username in searching_usernames}
+
+    def collect(self) -> bool:
+        """Collect the friendship status between the user with `username` and the user with `searching_username`.
+
+        Returns:
+            bool: True if the user with `searching_username` is found in the dialog of the user with `username`,
+            False otherwise.
+        """
+        return bool(self.collect_many([self.searching_username])[self.searching_username])
+
+
+class GetFollowerStatus(GetFriendshipStatus):
+    """Class for getting the reverse friendship status, searching the users in the
+    followers dialog of the user, i.e. checking if they follow the user.
+    """
+    users_type = "followers"
+    dialog_btn_xpath_format = FOLLOWERS_BTN_XPATH_FORMAT
+    search_url_format = FOLLOWERS_URL_FORMAT
+
+
+# whether a user follows another one, keyed by the usernames of the follower and the
+# followed user and the id of the logged in user, no matter in which dialog it's found
+_followings_cache = TTLCache(300, maxsize=1024)
+
+
+def _search_dialog(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                   collect_class: Type[GetFriendshipStatus],
+                   username: str,
+                   searching_usernames: Sequence[str],
+                   get_cache_key: Callable[[str, Optional[str]], Tuple[str, str, Optional[str]]]
+                   ) -> Dict[str, bool]:
+    """Search the users with `searching_usernames` in one dialog of the user with `username`,
+    skipping the users, whose results are cached.
+
+    Args:
+        driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
+         driver for controlling the browser to perform certain actions.
+        collect_class (Type[GetFriendshipStatus]): the class searching the dialog.
+        username (str): username of the user.
+        searching_usernames (Sequence[str]): usernames of the users to search for.
+        get_cache_key (Callable): gets the cache key from a searching username and the
+         id of the logged in user.
+
+    Returns:
+        Dict[str, bool]: for each of the `searching_usernames`, True if the user is found
+        in the dialog of the user with `username`, False otherwise.
+    """
+    viewer_id = get_viewer_id(driver)
+    statuses = {searching_username: _followings_cache.get(get_cache_key(searching_username, viewer_id))
+                for searching_username in searching_usernames}
+    missing = [searching_username for searching_username, status in statuses.items() if status is None]
+    if missing:
+        found = collect_class(driver, username, missing[0]).collect_many(missing)
+        for searching_username, status in found.items():
+            # only the verdicts of an actual search response are cached
+            if status is not None:
+                _followings_cache.set(get_cache_key(searching_username, viewer_id), status)
+        statuses.update(found)
+    return {searching_username: bool(status) for searching_username, status in statuses.items()}
+
+
+def are_following(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                  username: str,
+                  searching_usernames: Sequence[str]) -> Dict[str, bool]:
+    """Check if the user with `username` follows each of the users with `searching_usernames`.
+    All the users not cached yet are searched in one followings dialog of the user.
+    The results of the searches are cached for 5 minutes, use `crawlinsta.cache.invalidate(username)`
+    to drop them earlier, e.g. after following or unfollowing someone.
+
+    Args:
+        driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
+         driver for controlling the browser to perform certain actions.
+        username (str): username of the user.
+        searching_usernames (Sequence[str]): usernames of the users to search for.
+
+    Returns:
+        Dict[str, bool]: for each of the `searching_usernames`, True if the user is found
+        in the followings of the user with `username`, False otherwise.
+    """
+    return _search_dialog(driver, GetFriendshipStatus, username, searching_usernames,
+                          lambda searching_username, viewer_id: (username, searching_username, viewer_id))
+
+
+def are_followed_by(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                    username: str,
+                    searching_usernames: Sequence[str]) -> Dict[str, bool]:
+    """Check if each of the users with `searching_usernames` follows the user with `username`.
+    All the users not cached yet are searched in one followers dialog of the user. The results
+    share the cache with `are_following`, the same way after following or unfollowing someone.
+
+    Args:
+        driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
+         driver for controlling the browser to perform certain actions.
+        username (str): username of the user.
+        searching_usernames (Sequence[str]): usernames of the users to search for.
+
+    Returns:
+        Dict[str, bool]: for each of the `searching_usernames`, True if the user is found
+        in the followers of the user with `username`, False otherwise.
+    """
+    return _search_dialog(driver, GetFollowerStatus, username, searching_usernames,
+                          lambda searching_username, viewer_id: (searching_username, username, viewer_id))
+
+
+@driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
+def is_following(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                 username: str,
+                 searching_username: str) -> bool:
+    """Check if the user with `username` follows the user with `searching_username`.
+    The result is cached for 5 minutes, use `crawlinsta.cache.invalidate(username)`
+    to drop it earlier, e.g. after following or unfollowing someone.
+
+    Args:
+        driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
+         driver for controlling the browser to perform certain actions.
+        username (str): username of the user.
+        searching_username (str): username of the user to search for.
 
-        for user_info in self.json_data["users"]:  # type: ignore
-            if user_info["username"] != self.searching_username:
-                continue
-            return True
-        return False
+    Returns:
+        bool: True if the user with `searching_username` is found in the followings of
+        the user with `username`, False otherwise.
+    """
+    return are_following(driver, username, [searching_username])[searching_username]
 
 
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def get_friendship_status(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                           username1: str,
-                          username2: str) -> Json:
+                          username2: str,
+                          second_driver: Optional[Union[Chrome, Edge, Firefox, Safari, Remote]] = None) -> Json:
     """Get the relationship between the user with `username1` and the
     user with `username2`, i.e. finding out who is following whom.
 
@@ -126,6 +292,9 @@ def get_friendship_status(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
          driver for controlling the browser to perform certain actions.
         username1 (str): username of the person A.
         username2 (str): username of the person B.
+        second_driver (Optional[selenium.webdriver.remote.webdriver.WebDriver]): another
+         logged in selenium driver. If given, the followings of person B are searched
+         with it at the same time as the followings of person A, which halves the time.
 
     Returns:
         Json: friendship indication between person A with `username1` and
@@ -150,7 +319,77 @@ def get_friendship_status(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
           "followed_by": true
         }
     """
-    followed_by = GetFriendshipStatus(driver, username2, username1).collect()
-    following = GetFriendshipStatus(driver, username1, username2).collect()
-    return FriendshipStatus(following=following,
-                            followed_by=followed_by).model_dump(mode="json")
+    if second_driver is None:
+        followed_by = is_following(driver, username2, username1)
+        following = is_following(driver, username1, username2)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            followed_by_future = executor.submit(is_following, second_driver, username2, username1)
+            following = is_following(driver, username1, username2)
+            followed_by = followed_by_future.result()
+    return FriendshipStatus.model_construct(following=following,
+                                            followed_by=followed_by).model_dump(mode="json")
+
+
+@driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
+def get_friendship_statuses(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                            username: str,
+                            usernames: Sequence[str],
+                            second_driver: Optional[Union[Chrome, Edge, Firefox, Safari, Remote]] = None
+                            ) -> Dict[str, Json]:
+    """Get the relationship between the user with `username` and each of the
+    users with `usernames`. Compared to calling `get_friendship_status` for each
+    pair, the other persons are searched in one go in the followings dialog and
+    then in the followers dialog of the user with `username`, so that only two
+    profile pages are loaded, no matter how many other persons there are.
+
+    Args:
+        driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
+         driver for controlling the browser to perform certain actions.
+        username (str): username of the person A.
+        usernames (Sequence[str]): usernames of the other persons.
+        second_driver (Optional[selenium.webdriver.remote.webdriver.WebDriver]): another
+         logged in selenium driver. If given, the followers of person A are searched
+         with it at the same time as the followings of person A.
+
+    Returns:
+        Dict[str, Json]: friendship indication between person A with `username` and
+        each of the other persons, keyed by their usernames. "following" indicates
+        if person A is following the other person, and "followed_by" indicates if
+        person A is followed by the other person.
+
+    Raises:
+        ValueError: if the user with the given username is not found.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> from crawlinsta.login import login, login_with_cookies
+        >>> from crawlinsta.collecting import get_friendship_statuses
+        >>> driver = webdriver.Chrome('path_to_chromedriver')
+        >>> # if you already used once the login function, you can use the
+        >>> # login_with_cookies function to login with the cookie file.
+        >>> login(driver, "your_username", "your_password")  # or login_with_cookies(driver)
+        >>> get_friendship_statuses(driver, "instagram_username1", ["instagram_username2", "instagram_username3"])
+        {
+          "instagram_username2": {
+            "following": false,
+            "followed_by": true
+          },
+          "instagram_username3": {
+            "following": true,
+            "followed_by": true
+          }
+        }
+    """
+    if second_driver is None:
+        followed_by = are_followed_by(driver, username, usernames)
+        following = are_following(driver, username, usernames)
+    else:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            followed_by_future = executor.submit(are_followed_by, second_driver, username, usernames)
+            following = are_following(driver, username, usernames)
+            followed_by = followed_by_future.result()
+    return {other: FriendshipStatus.model_construct(following=following[other],
+                                                    followed_by=followed_by[other]).model_dump(mode="json")
+            for other in usernames}
@@ -1,8 +1,4 @@
-import json
 import logging
-import random
-import time
-from urllib.parse import parse_qs
 from pydantic import Json
 from selenium.webdriver.common.by import By
 from seleniumwire.request import Request
@@ -12,10 +8,13 @@ from ..schemas import (
     UserProfile, HashtagBasicInfo, SearchingResultHashtag, SearchingResultUser,
     LocationBasicInfo, Place, SearchingResultPlace, SearchingResult
 )
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
+from ..utils import search_request, get_json_data, filter_requests, get_request_data, wait_for_request
+from ..decorators import driver_implicit_wait, driver_capture_scopes
 from ..data_extraction import extract_id
-from ..constants import INSTAGRAM_DOMAIN, JsonResponseContentType
+from ..constants import (
+    INSTAGRAM_DOMAIN, JsonResponseContentType, GRAPHQL_API_URL, API_CAPTURE_SCOPES,
+    SEARCH_BTN_XPATH, SEARCH_INPUT_XPATH, NOT_PERSONALISED_BTN_XPATH
+)
 from .base import CollectBase
 
 logger = logging.getLogger("crawlinsta")
@@ -56,6 +55,11 @@ class SearchWithKeyword(CollectBase):
         self.json_requests: List[Request] = []
         self.json_data: Union[Dict[str, Any], None] = None
 
+    def wait_for_webpage(self) -> None:
+        """No fixed waiting, the search button is looked up with the implicit
+        wait of the driver, which returns as soon as it's shown."""
+        pass
+
     def check_request_data(self, request: Request) -> bool:
         """Check request data.
 
@@ -65,8 +69,7 @@ class SearchWithKeyword(CollectBase):
         Returns:
             bool: True if request data is valid, False otherwise.
         """
-        request_data = parse_qs(request.body.decode())
-        variables = json.loads(request_data.get("variables", ["{}"])[0])
+        _, variables = get_request_data(request)
         if not variables:
             return False
         elif self.pers and variables.get("data", dict(query=""))["query"] != self.keyword:
@@ -81,7 +84,7 @@ class SearchWithKeyword(CollectBase):
         Returns:
             bool: True if data is extracted successfully, False otherwise.
         """
-        target_url = f"{INSTAGRAM_DOMAIN}/api/graphql"
+        target_url = GRAPHQL_API_URL
         idx = search_request(self.json_requests, target_url,
                              JsonResponseContentType.text_javascript,
                              self.check_request_data)
@@ -96,35 +99,27 @@ class SearchWithKeyword(CollectBase):
 
     def fetch_data(self) -> None:
         """Loading action."""
-        search_btn = self.driver.find_element(By.XPATH, '//a[@href="#"][@role="link"]')
+        search_btn = self.driver.find_element(By.XPATH, SEARCH_BTN_XPATH)
         search_btn.click()
-        time.sleep(random.SystemRandom().randint(4, 6))
 
         del self.driver.requests
 
-        search_input_box = self.driver.find_element(
-            By.XPATH, '//input'
-                      '[@aria-label="Search input" or @aria-label="Sucheingabe"]'
-                      '[@placeholder="Search" or @placeholder="Suchen"]'
-                      '[@type="text"]')
+        # the search input box is looked up with the implicit wait of the driver
+        search_input_box = self.driver.find_element(By.XPATH, SEARCH_INPUT_XPATH)
         search_input_box.send_keys(self.keyword)
-        time.sleep(random.SystemRandom().randint(6, 8))
+        captured_requests = wait_for_request(self.driver, GRAPHQL_API_URL,
+                                             JsonResponseContentType.text_javascript,
+                                             self.check_request_data)
 
         if not self.pers:
             del self.driver.requests
-            not_pers_btn = self.driver.find_element(
-                By.XPATH,
-                '//div[@aria-label="Not personalised" '
-                'or @aria-label="Not personalized" '
-                'or @aria-label="Nicht personalisiert"]'
-                '[@role="button"][@tabindex="0"]'
-                '//span[text()="Not personalised" '
-                'or text()="Not personalized" '
-                'or text()="Nicht personalisiert"]')
+            not_pers_btn = self.driver.find_element(By.XPATH, NOT_PERSONALISED_BTN_XPATH)
             not_pers_btn.click()
-            time.sleep(random.SystemRandom().randint(6, 8))
+            captured_requests = wait_for_request(self.driver, GRAPHQL_API_URL,
+                                                 JsonResponseContentType.text_javascript,
+                                                 self.check_request_data)
 
-        self.json_requests = filter_requests(self.driver.requests, JsonResponseContentType.text_javascript)
+        self.json_requests = filter_requests(captured_requests, JsonResponseContentType.text_javascript)
         del self.driver.requests
 
     def generate_result(self, empty_result: bool = False) -> Json:
@@ -137,10 +132,10 @@ class SearchWithKeyword(CollectBase):
             Json: searching result.
         """
         if empty_result:
-            return SearchingResult(hashtags=[],
-                                   users=[],
-                                   places=[],
-                                   personalised=self.pers).model_dump(mode="json")
+            return SearchingResult.model_construct(hashtags=[],
+                                                   users=[],
+                                                   places=[],
+                                                   personalised=self.pers).model_dump(mode="json")
         hashtags = []
         places = []
         if self.pers:
@@ -182,10 +177,10 @@ class SearchWithKeyword(CollectBase):
                                                         is_private=user_info_dict.get("is_private")))
             users.append(user)
 
-        searching_result = SearchingResult(hashtags=hashtags,
-                                           users=users,
-                                           places=places,
-                                           personalised=self.pers)
+        searching_result = SearchingResult.model_construct(hashtags=hashtags,
+                                                           users=users,
+                                                           places=places,
+                                                           personalised=self.pers)
         return searching_result.model_dump(mode="json")
 
     def collect(self) -> Json:
@@ -205,6 +200,7 @@ class SearchWithKeyword(CollectBase):
 
 
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def search_with_keyword(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                         keyword: str,
                         pers: bool) -> Json:
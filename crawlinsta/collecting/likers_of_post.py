@@ -1,15 +1,15 @@
 import logging
-import random
-import time
 from pydantic import Json
 from selenium.webdriver.common.by import By
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
 from typing import Union
 from ..schemas import Users
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
+from ..utils import search_request, get_json_data, filter_requests, get_default_result, wait_for_request
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache, skip_caching
 from ..data_extraction import create_users_list
-from ..constants import INSTAGRAM_DOMAIN, API_VERSION, JsonResponseContentType
+from ..constants import (
+    INSTAGRAM_DOMAIN, JsonResponseContentType, LIKERS_URL_FORMAT, API_CAPTURE_SCOPES, LIKES_BTN_XPATH_FORMAT
+)
 from .base import CollectPostInfoBase
 
 logger = logging.getLogger("crawlinsta")
@@ -46,12 +46,12 @@ class CollectLikersOfPost(CollectPostInfoBase):
 
     def fetch_data(self) -> None:
         """Fetch the data by clicking the likes button of the post."""
-        likes_btn_xpath = f"//a[@href='/p/{self.post_code}/liked_by/'][@role='link']"
+        likes_btn_xpath = LIKES_BTN_XPATH_FORMAT.format(post_code=self.post_code)
         likes_btn = self.driver.find_element(By.XPATH, likes_btn_xpath)
         likes_btn.click()
-        time.sleep(random.SystemRandom().randint(3, 5))
 
-        self.json_requests += filter_requests(self.driver.requests)
+        target_url = LIKERS_URL_FORMAT.format(post_id=self.post_id)
+        self.json_requests += filter_requests(wait_for_request(self.driver, target_url))
         del self.driver.requests
 
     def extract_data(self) -> bool:
@@ -60,7 +60,7 @@ class CollectLikersOfPost(CollectPostInfoBase):
         Returns:
             bool: True if the data is extracted successfully, False otherwise.
         """
-        target_url = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/media/{self.post_id}/likers/"
+        target_url = LIKERS_URL_FORMAT.format(post_id=self.post_id)
         idx = search_request(self.json_requests,
                              target_url,
                              JsonResponseContentType.application_json)
@@ -83,10 +83,10 @@ class CollectLikersOfPost(CollectPostInfoBase):
             Json: all likers' user information of the given post in json format.
         """
         if empty_result:
-            return Users(users=[], count=0).model_dump(mode="json")
+            return get_default_result(Users)
 
-        likers = create_users_list(self.json_data_list, "users")[:self.n]
-        return Users(users=likers, count=len(likers)).model_dump(mode="json")
+        likers = create_users_list(self.json_data_list, "users", self.n)
+        return Users.model_construct(users=likers, count=len(likers)).model_dump(mode="json")
 
     def collect(self) -> Json:
         """Collect the users, who likes a given post.
@@ -100,6 +100,7 @@ class CollectLikersOfPost(CollectPostInfoBase):
         self.get_post_id()
         if not self.post_id:
             logger.warning(f"No post id found for post '{self.post_code}'.")
+            skip_caching()
             return self.generate_result(empty_result=True)
         del self.driver.requests
 
@@ -107,16 +108,21 @@ class CollectLikersOfPost(CollectPostInfoBase):
         status = self.extract_data()
         if not status:
             logger.warning(f"No likers found for post '{self.post_code}'.")
+            skip_caching()
             return self.generate_result(empty_result=True)
 
         return self.generate_result(empty_result=False)
 
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_likers_of_post(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                            post_code: str,
                            n: int = 100) -> Json:
     """Collect the users, who likes a given post.
+    The result is cached for 5 minutes, use `collect_likers_of_post.invalidate(post_code)`
+    to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
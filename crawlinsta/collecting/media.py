@@ -1,10 +1,9 @@
 import logging
-import random
-import time
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union
+from typing import Union, Sequence, Tuple
 from ..decorators import driver_implicit_wait
-from ..utils import search_request
+from ..utils import wait_for_matching_request
+from .batch import collect_in_parallel
 
 logger = logging.getLogger("crawlinsta")
 
@@ -38,14 +37,46 @@ def download_media(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
         >>> download_media(driver, "https://scontent-muc2-1.xx.fbcdn.net/v/t39.12897-6/4197848_n.m4a", "tmp")
     """
     driver.get(media_url)
-    time.sleep(random.SystemRandom().randint(4, 6))
-
-    idx = search_request(driver.requests, media_url, response_content_type=None)
-    if idx is None:
+    request = wait_for_matching_request(driver, media_url, response_content_type=None)
+    if request is None:
         raise ValueError(f"Media url '{media_url}' not found.")
-    request = driver.requests.pop(idx)
-    file_extension = request.response.headers["Content-Type"].split("/")[1]
+    # the parameters of the content type, e.g. `video/mp4; codecs="avc1"`, are not
+    # part of the file extension
+    content_type = request.response.headers.get("Content-Type", "application/octet-stream")
+    file_extension = content_type.split(";", 1)[0].split("/", 1)[-1].strip() or "bin"
     with open(f"{file_name}.{file_extension}", "wb") as f:
         f.write(request.response.body)
-        f.close()
     logger.info(f"Media downloaded successfully to '{file_name}.{file_extension}'.")
+
+
+def download_media_many(drivers: Sequence[Union[Chrome, Edge, Firefox, Safari, Remote]],
+                        media_urls_and_file_names: Sequence[Tuple[str, str]]) -> None:
+    """Download several images/videos concurrently, each one stored to its given path.
+
+    The downloads are distributed over the given drivers, so that as many media
+    are loaded at the same time as there are drivers. The browsers keep their
+    connections to the Instagram CDN alive, so the later downloads of a driver
+    skip the connection establishment.
+
+    Args:
+        drivers (Sequence[Union[Chrome, Edge, Firefox, Safari, Remote]]): logged in
+         selenium drivers, each one of them downloads one media at a time.
+        media_urls_and_file_names (Sequence[Tuple[str, str]]): pairs of the url of
+         the media for downloading and the path for storing the downloaded media.
+
+    Raises:
+        ValueError: if no driver is given or a media url is not found.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> from crawlinsta.login import login_with_cookies
+        >>> from crawlinsta.collecting import download_media_many
+        >>> drivers = [webdriver.Chrome('path_to_chromedriver') for _ in range(2)]
+        >>> for driver in drivers:
+        ...     login_with_cookies(driver)
+        >>> download_media_many(drivers, [("https://scontent-muc2-1.xx.fbcdn.net/v/t39.12897-6/4197848_n.m4a", "tmp1"),
+        ...                               ("https://scontent-muc2-1.xx.fbcdn.net/v/t39.12897-6/4197849_n.m4a", "tmp2")])
+    """
+    collect_in_parallel(drivers,
+                        lambda driver, media_url_and_file_name: download_media(driver, *media_url_and_file_name),
+                        media_urls_and_file_names)
@@ -1,16 +1,14 @@
 import logging
-import random
-import time
-from urllib.parse import parse_qs
+from urllib.parse import quote
 from pydantic import Json
 from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
 from typing import Union, List, Dict, Any
-from ..schemas import MusicPosts, Music
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
+from ..schemas import MusicPosts, Music, Post
+from ..utils import search_request, get_json_data, filter_requests, get_request_data, wait_for_request
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache, skip_caching
 from ..data_extraction import extract_post, extract_music_info, extract_sound_info
-from ..constants import INSTAGRAM_DOMAIN, API_VERSION, JsonResponseContentType
+from ..constants import INSTAGRAM_DOMAIN, JsonResponseContentType, MUSIC_CLIPS_URL, API_CAPTURE_SCOPES
 from .base import CollectBase
 
 logger = logging.getLogger("crawlinsta")
@@ -22,7 +20,9 @@ class CollectPostsByMusicId(CollectBase):
     Attributes:
         driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium driver.
         music_id (str): id of the music.
+        music_id_form_field (bytes): the url-encoded form field of the music id in the request bodies.
         n (int): maximum number of posts to collect.
+        captured_requests (List[Request]): requests captured while loading the webpage.
     """
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
@@ -40,11 +40,24 @@ class CollectPostsByMusicId(CollectBase):
                              "must be a positive integer.")
         super().__init__(driver, f'{INSTAGRAM_DOMAIN}/reels/audio/{music_id}/')
         self.music_id = music_id
+        self.music_id_form_field = f"audio_cluster_id={quote(music_id, safe='')}".encode()
         self.n = n
-        self.target_url = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/clips/music/"
-        self.json_data_list: List[Dict[str, Any]] = []
+        self.target_url = MUSIC_CLIPS_URL
+        self.posts: List[Post] = []
+        self.paging_info: Dict[str, Any] = {}
+        # the music information is taken from the first page
+        self.metadata: Dict[str, Any] = {}
+        self.media_count: Dict[str, Any] = {}
         self.remaining = n
         self.json_requests: List[Request] = []
+        self.captured_requests: List[Request] = []
+
+    def wait_for_webpage(self) -> None:
+        """Wait until the response with the first page of the posts is captured, the
+        captured requests are kept for extracting it."""
+        self.captured_requests = wait_for_request(self.driver, self.target_url,
+                                                  JsonResponseContentType.application_json,
+                                                  self.check_request_data)
 
     def check_request_data(self, request: Request, max_id: str = "") -> bool:
         """Check if the request data is valid.
@@ -56,7 +69,10 @@ class CollectPostsByMusicId(CollectBase):
         Returns:
             bool: True if the request data is valid, False otherwise.
         """
-        request_data = parse_qs(request.body.decode())
+        # cheap check on the raw body before parsing it
+        if self.music_id_form_field not in request.body:
+            return False
+        request_data, _ = get_request_data(request)
         if request_data.get("max_id", [""])[0] != max_id:
             return False
         elif request_data.get("audio_cluster_id", [""])[0] != self.music_id:
@@ -69,7 +85,7 @@ class CollectPostsByMusicId(CollectBase):
         Raises:
             ValueError: if the music id is not found.
         """
-        self.json_requests += filter_requests(self.driver.requests,
+        self.json_requests += filter_requests(self.captured_requests,
                                               JsonResponseContentType.application_json)
         del self.driver.requests
 
@@ -82,7 +98,7 @@ class CollectPostsByMusicId(CollectBase):
         Returns:
             bool: True if the data is extracted successfully, False otherwise.
         """
-        max_id = self.json_data_list[-1]["paging_info"]['max_id'] if self.json_data_list else ""
+        max_id = self.paging_info['max_id'] if self.paging_info else ""
         idx = search_request(self.json_requests, self.target_url,
                              JsonResponseContentType.application_json,
                              self.check_request_data, max_id)
@@ -90,8 +106,18 @@ class CollectPostsByMusicId(CollectBase):
             return False
 
         request = self.json_requests.pop(idx)
+        # the requests are kept in the order they were captured, the ones before the
+        # page can't be a following page, so they aren't searched through again
+        del self.json_requests[:idx]
         json_data = get_json_data(request.response)
-        self.json_data_list.append(json_data)
+        if not self.paging_info:
+            self.metadata = json_data["metadata"]
+            self.media_count = json_data["media_count"]
+        # the posts are extracted right away page by page, only the paging
+        # information of the page is kept for loading the next page
+        for item in json_data["items"][:self.remaining]:
+            self.posts.append(extract_post(item["media"]))
+        self.paging_info = json_data["paging_info"]
         self.remaining -= len(json_data["items"])
         return True
 
@@ -101,15 +127,16 @@ class CollectPostsByMusicId(CollectBase):
         Returns:
             bool: True if there are more posts to fetch, False otherwise.
         """
-        return self.json_data_list[-1]['paging_info']["more_available"] and self.remaining > 0
+        return self.paging_info["more_available"] and self.remaining > 0
 
-    def fetching_more_data(self):
+    def fetch_more_data(self) -> None:
         """Loading action."""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(random.SystemRandom().randint(4, 6))
+        requests = wait_for_request(self.driver, self.target_url,
+                                    JsonResponseContentType.application_json,
+                                    self.check_request_data, self.paging_info["max_id"])
 
-        self.json_requests += filter_requests(self.driver.requests,
-                                              JsonResponseContentType.application_json)
+        self.json_requests += filter_requests(requests, JsonResponseContentType.application_json)
         del self.driver.requests
 
     def generate_result(self, empty_result=False) -> Json:
@@ -122,31 +149,23 @@ class CollectPostsByMusicId(CollectBase):
             Json: a list of posts containing the music.
         """
         if empty_result:
-            return MusicPosts(posts=[],
-                              music=Music(id=self.music_id),  # type: ignore
-                              count=0).model_dump(mode="json")  # type: ignore
-
-        posts = []
-        for result in self.json_data_list:
-            for item in result['items']:
-                item_dict = item["media"]
-                post = extract_post(item_dict)
-                posts.append(post)
-        posts = posts[:self.n]
-
-        metadata = self.json_data_list[0]["metadata"]
-        media_count = self.json_data_list[0]["media_count"]
-
-        if metadata.get("music_info"):
-            music_basic = extract_music_info(metadata["music_info"])
+            return MusicPosts.model_construct(posts=[],
+                                              music=Music(id=self.music_id),  # type: ignore
+                                              count=0).model_dump(mode="json")
+
+        music_info = self.metadata.get("music_info")
+        if music_info:
+            music_basic = extract_music_info(music_info)
         else:
-            music_basic = extract_sound_info(metadata["original_sound_info"])
-        music = Music(**music_basic.model_dump(),
-                      clips_count=media_count["clips_count"],
-                      photos_count=media_count["photos_count"])
-        return MusicPosts(posts=posts,
-                          music=music,
-                          count=len(posts)).model_dump(mode="json")  # type: ignore
+            music_basic = extract_sound_info(self.metadata["original_sound_info"])
+        # unpack the fields directly, dumping them first would serialize the
+        # nested artist and validate it again from scratch.
+        music = Music(**dict(music_basic),
+                      clips_count=self.media_count["clips_count"],
+                      photos_count=self.media_count["photos_count"])
+        return MusicPosts.model_construct(posts=self.posts,
+                                          music=music,
+                                          count=len(self.posts)).model_dump(mode="json")
 
     def collect(self) -> Json:
         """Collect posts containing the given music_id.
@@ -162,22 +181,23 @@ class CollectPostsByMusicId(CollectBase):
         status = self.extract_data()
         if not status:
             logger.warning(f"No data found for music id '{self.music_id}'.")
+            skip_caching()
             return self.generate_result(empty_result=True)  # type: ignore
 
-        while self.continue_fetching():
-            self.fetching_more_data()
-            status = self.extract_data()
-            if not status:
-                break
-
+        if not self.paginate():
+            skip_caching()
         return self.generate_result(empty_result=False)
 
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_posts_by_music_id(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                               music_id: str,
                               n: int = 100) -> Json:
     """Collect n posts containing the given music_id. If n is set to 0, collect all posts.
+    The result is cached for 5 minutes, use `collect_posts_by_music_id.invalidate(music_id)`
+    to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
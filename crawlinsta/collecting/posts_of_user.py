@@ -1,11 +1,10 @@
-import json
-from urllib.parse import parse_qs
 from pydantic import Json
-from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union
-from ..decorators import driver_implicit_wait
-from ..constants import INSTAGRAM_DOMAIN, JsonResponseContentType
+from typing import Union, Dict, Any
+from ..decorators import driver_implicit_wait, driver_capture_scopes
+from ..constants import (
+    INSTAGRAM_DOMAIN, JsonResponseContentType, GRAPHQL_API_URL, GRAPHQL_QUERY_URL, API_CAPTURE_SCOPES
+)
 from .base import CollectPostsBase
 
 
@@ -23,7 +22,7 @@ class CollectPostsOfUser(CollectPostsBase):
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                  username: str,
                  n: int = 100,
-                 target_url: str = f"{INSTAGRAM_DOMAIN}/api/graphql",
+                 target_url: str = GRAPHQL_API_URL,
                  response_content_type: str = JsonResponseContentType.text_javascript) -> None:
         """Initializes the CollectPostsOfUser class.
 
@@ -40,6 +39,11 @@ class CollectPostsOfUser(CollectPostsBase):
         super().__init__(driver, username, n, url, target_url, response_content_type,
                          collect_type, json_data_key, ("node", ))
 
+    def wait_for_webpage(self) -> None:
+        """The user id isn't needed for the posts, the response with the first
+        posts is waited for in `fetch_data`."""
+        pass
+
     def get_user_id(self) -> bool:
         """Get the user id of the given user.
 
@@ -48,32 +52,21 @@ class CollectPostsOfUser(CollectPostsBase):
         """
         return False
 
-    def check_request_data(self, request: Request, after: str = "") -> bool:
-        """Check if the request data is valid.
+    def is_page_variables(self, variables: Dict[str, Any]) -> bool:
+        """Check if the graphql variables of a request ask for a page of the user's posts.
 
         Args:
-            request (seleniumwire.request.Request): request object.
-            after (str): cursor for the next page.
+            variables (Dict[str, Any]): graphql variables of the request.
 
         Returns:
-            bool: True if the request data is valid, False otherwise.
+            bool: True if the variables ask for a page of the user, False otherwise.
         """
-        request_data = parse_qs(request.body.decode())
-        variables = json.loads(request_data.get("variables", ["{}"])[0])
-        if request_data.get("av", [''])[0] != "17841461911219001":
-            return False
-        elif not variables:
-            return False
-        elif variables.get("username", "") != self.username:
-            return False
-        elif variables.get("after", "") != after:
-            return False
-        elif variables.get("data", dict()).get("count") is None:
-            return False
-        return True
+        return variables.get("username", "") == self.username and \
+            variables.get("data", dict()).get("count") is not None
 
 
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_posts_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                           username: str,
                           n: int = 100) -> Json:
@@ -154,14 +147,14 @@ def collect_posts_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
           "count": 100
         }
     """
-    cp = CollectPostsOfUser(driver, username, n, f"{INSTAGRAM_DOMAIN}/api/graphql",
+    cp = CollectPostsOfUser(driver, username, n, GRAPHQL_API_URL,
                             JsonResponseContentType.text_javascript)
     result = cp.collect()
     if result["count"] > 0 or not cp.no_data_found:
         return result
     try:
         return CollectPostsOfUser(driver, username, n,
-                                  f"{INSTAGRAM_DOMAIN}/graphql/query",
+                                  GRAPHQL_QUERY_URL,
                                   JsonResponseContentType.application_json).collect()
     except Exception:
         return result
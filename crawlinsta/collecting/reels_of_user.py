@@ -1,11 +1,10 @@
-import json
-from urllib.parse import parse_qs
 from pydantic import Json
-from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union
-from ..decorators import driver_implicit_wait
-from ..constants import INSTAGRAM_DOMAIN, JsonResponseContentType
+from typing import Union, Dict, Any
+from ..decorators import driver_implicit_wait, driver_capture_scopes
+from ..constants import (
+    INSTAGRAM_DOMAIN, JsonResponseContentType, GRAPHQL_API_URL, GRAPHQL_QUERY_URL, API_CAPTURE_SCOPES
+)
 from .base import CollectPostsBase
 
 
@@ -23,7 +22,7 @@ class CollectReelsOfUser(CollectPostsBase):
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                  username: str,
                  n: int = 100,
-                 target_url: str = f"{INSTAGRAM_DOMAIN}/api/graphql",
+                 target_url: str = GRAPHQL_API_URL,
                  response_content_type: str = JsonResponseContentType.text_javascript) -> None:
         """Constructor method.
 
@@ -40,32 +39,21 @@ class CollectReelsOfUser(CollectPostsBase):
         super().__init__(driver, username, n, url, target_url, response_content_type,
                          collect_type, json_data_key, ("node", "media"))
 
-    def check_request_data(self, request: Request, after: str = "") -> bool:
-        """Check if the request data is valid.
+    def is_page_variables(self, variables: Dict[str, Any]) -> bool:
+        """Check if the graphql variables of a request ask for a page of the user's reels.
 
         Args:
-            request (Request): request object.
-            after (str): cursor for the next page.
+            variables (Dict[str, Any]): graphql variables of the request.
 
         Returns:
-            bool: True if the request data is valid, False otherwise.
+            bool: True if the variables ask for a page of the user, False otherwise.
         """
-        request_data = parse_qs(request.body.decode())
-        variables = json.loads(request_data.get("variables", ["{}"])[0])
-        if request_data.get("av", [''])[0] != "17841461911219001":
-            return False
-        elif not variables:
-            return False
-        elif variables.get("data", dict()).get("target_user_id", "") != self.user_id:
-            return False
-        elif variables.get("data", dict()).get("page_size") is None:
-            return False
-        elif variables.get("after", "") != after:
-            return False
-        return True
+        return variables.get("data", dict()).get("target_user_id", "") == self.user_id and \
+            variables.get("data", dict()).get("page_size") is not None
 
 
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_reels_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                           username: str,
                           n: int = 100) -> Json:
@@ -146,14 +134,14 @@ def collect_reels_of_user(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
           "count": 100
         }
     """
-    cr = CollectReelsOfUser(driver, username, n, f"{INSTAGRAM_DOMAIN}/api/graphql",
+    cr = CollectReelsOfUser(driver, username, n, GRAPHQL_API_URL,
                             JsonResponseContentType.text_javascript)
     result = cr.collect()
     if result["count"] > 0 or not cr.no_data_found:
         return result
     try:
         return CollectReelsOfUser(driver, username, n,
-                                  f"{INSTAGRAM_DOMAIN}/graphql/query",
+                                  GRAPHQL_QUERY_URL,
                                   JsonResponseContentType.application_json).collect()
     except Exception:
         return result
@@ -1,13 +1,14 @@
 import logging
+from itertools import chain
 from pydantic import Json
 from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
 from typing import Union, Dict, Any, List
-from ..schemas import Hashtag
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
+from ..schemas import Hashtag, Post
+from ..utils import search_request, get_json_data, filter_requests, wait_for_request
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache, skip_caching
 from ..data_extraction import extract_post, extract_id
-from ..constants import INSTAGRAM_DOMAIN, API_VERSION
+from ..constants import INSTAGRAM_DOMAIN, TAG_WEB_INFO_URL_FORMAT, API_CAPTURE_SCOPES
 from .base import CollectBase
 
 logger = logging.getLogger("crawlinsta")
@@ -20,7 +21,9 @@ class CollectTopPostsOfHashtag(CollectBase):
         driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium
          driver for controlling the browser to perform certain actions.
         hashtag (str): hashtag.
+        target_url (str): url of the request with the hashtag information.
         json_requests (list): list of json requests.
+        captured_requests (list): requests captured while loading the webpage.
         hashtag_data (dict): hashtag data.
     """
     def __init__(self, driver: Union[Chrome, Edge, Firefox, Safari, Remote],
@@ -34,16 +37,23 @@ class CollectTopPostsOfHashtag(CollectBase):
         """
         super().__init__(driver, f'{INSTAGRAM_DOMAIN}/explore/tags/{hashtag}')
         self.hashtag = hashtag
+        self.target_url = TAG_WEB_INFO_URL_FORMAT.format(hashtag=hashtag)
         self.json_requests: List[Request] = []
+        self.captured_requests: List[Request] = []
         self.hashtag_data: Union[Dict[str, Any], None] = None
 
+    def wait_for_webpage(self) -> None:
+        """Wait until the response with the hashtag information is captured, the
+        captured requests are kept for extracting it."""
+        self.captured_requests = wait_for_request(self.driver, self.target_url)
+
     def fetch_data(self) -> None:
         """Fetch data from the requests.
 
         Raises:
             ValueError: if the hashtag is not found.
         """
-        self.json_requests += filter_requests(self.driver.requests)
+        self.json_requests += filter_requests(self.captured_requests)
         del self.driver.requests
 
         if not self.json_requests:
@@ -55,8 +65,7 @@ class CollectTopPostsOfHashtag(CollectBase):
         Returns:
             bool: True if data is found, False otherwise.
         """
-        target_url = f'{INSTAGRAM_DOMAIN}/{API_VERSION}/tags/web_info/?tag_name={self.hashtag}'
-        idx = search_request(self.json_requests, target_url)
+        idx = search_request(self.json_requests, self.target_url)
         if idx is None:
             return False
         request = self.json_requests.pop(idx)
@@ -76,17 +85,17 @@ class CollectTopPostsOfHashtag(CollectBase):
         if empty_result:
             return Hashtag(id=None,
                            name=self.hashtag).model_dump(mode="json")  # type: ignore
-        posts = []
+        posts: List[Post] = []
         for section in self.hashtag_data["data"]["top"]["sections"]:  # type: ignore
+            layout_content = section["layout_content"]
             if section["layout_type"] == "one_by_two_left":
-                items = section["layout_content"].get("fill_items", [])
-                items += section["layout_content"].get("one_by_two_item", dict()).get("clips", dict()).get("items", [])
-
+                # the default dicts are only created if the keys are missing, and the
+                # fill items of the response are chained instead of being extended
+                clips = (layout_content.get("one_by_two_item") or {}).get("clips") or {}
+                items = chain(layout_content.get("fill_items", []), clips.get("items", []))
             else:
-                items = section["layout_content"].get("medias", [])
-            for item in items:
-                post = extract_post(item["media"])
-                posts.append(post)
+                items = layout_content.get("medias", [])
+            posts.extend(extract_post(item["media"]) for item in items)
         tag = Hashtag(id=extract_id(self.hashtag_data["data"]),  # type: ignore
                       name=self.hashtag_data["data"]["name"],  # type: ignore
                       post_count=self.hashtag_data["data"]["media_count"],  # type: ignore
@@ -110,15 +119,20 @@ class CollectTopPostsOfHashtag(CollectBase):
         status = self.extract_data()
         if not status:
             logger.warning(f"No data found for hashtag '{self.hashtag}'.")
+            skip_caching()
             return self.generate_result(empty_result=True)
 
         return self.generate_result(empty_result=False)
 
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_top_posts_of_hashtag(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
                                  hashtag: str) -> Json:
     """Collect top posts of a given hashtag.
+    The result is cached for 5 minutes, use `collect_top_posts_of_hashtag.invalidate(hashtag)`
+    to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
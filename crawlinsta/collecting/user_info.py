@@ -1,17 +1,18 @@
 import json
 import logging
-import random
-import time
 from urllib.parse import quote, urlencode
 from pydantic import Json
 from selenium.webdriver.common.by import By
 from seleniumwire.request import Request
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
-from typing import Union, List
+from typing import Union, List, Optional
 from ..schemas import UserInfo
-from ..utils import search_request, get_json_data, filter_requests
-from ..decorators import driver_implicit_wait
-from ..constants import INSTAGRAM_DOMAIN, GRAPHQL_QUERY_PATH, FOLLOWING_DOC_ID, JsonResponseContentType
+from ..utils import search_request, get_json_data, filter_requests, wait_for_request
+from ..decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache, skip_caching
+from ..constants import (
+    INSTAGRAM_DOMAIN, FOLLOWING_DOC_ID, JsonResponseContentType, GRAPHQL_QUERY_URL, API_CAPTURE_SCOPES,
+    FOLLOWING_BTN_XPATH_FORMAT, HASHTAGS_TAB_XPATH
+)
 from .base import UserIDRequiredCollect
 
 logger = logging.getLogger("crawlinsta")
@@ -24,48 +25,60 @@ class CollectUserInfo(UserIDRequiredCollect):
         driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium
          driver for controlling the browser to perform certain actions.
         username (str): name of the user.
+        include_following_hashtags (bool): whether to open the followings dialog
+         to count the hashtags followed by the user.
         json_requests (list): list of json requests.
     """
     def __init__(self,
                  driver: Union[Chrome, Edge, Firefox, Safari, Remote],
-                 username: str) -> None:
+                 username: str,
+                 include_following_hashtags: bool = True) -> None:
         """Constructs all the necessary attributes for the CollectUserInfo object.
 
         Args:
             driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium
              driver for controlling the browser to perform certain actions.
             username (str): name of the user.
+            include_following_hashtags (bool): whether to open the followings dialog
+             to count the hashtags followed by the user.
         """
         super().__init__(driver, username, f"{INSTAGRAM_DOMAIN}/{username}/")
+        self.include_following_hashtags = include_following_hashtags
         self.json_requests: List[Request] = []
 
     def load_following_hashtags(self) -> None:
         """Load the following hashtags of the user."""
-        following_btn_xpath = f"//a[@href='/{self.username}/following/'][@role='link']"
+        following_btn_xpath = FOLLOWING_BTN_XPATH_FORMAT.format(username=self.username)
         following_btn = self.driver.find_element(By.XPATH, following_btn_xpath)
         following_btn.click()
 
-        time.sleep(random.SystemRandom().randint(3, 5))
-
-        hashtag_btn = self.driver.find_element(By.XPATH, "//span[text()='Hashtags']")
+        # the implicit wait of the driver waits for the dialog to show the tab
+        hashtag_btn = self.driver.find_element(By.XPATH, HASHTAGS_TAB_XPATH)
         hashtag_btn.click()
-        time.sleep(random.SystemRandom().randint(4, 6))
-
-        self.json_requests += filter_requests(self.driver.requests)
+        self.json_requests += filter_requests(wait_for_request(self.driver, self.get_following_hashtags_url()))
         del self.driver.requests
 
+    def get_following_hashtags_url(self) -> str:
+        """Get the url of the request for the following hashtags of the user.
+
+        Returns:
+            str: url of the request.
+        """
+        variables = dict(id=self.user_id)
+        query_dict = dict(doc_id=FOLLOWING_DOC_ID, variables=json.dumps(variables, separators=(',', ':')))
+        return f"{GRAPHQL_QUERY_URL}/?{urlencode(query_dict, quote_via=quote)}"
+
     def get_following_hashtags_number(self) -> int:
         """Get the number of following hashtags of the user.
 
         Returns:
             int: number of following hashtags.
         """
-        variables = dict(id=self.user_id)
-        query_dict = dict(doc_id=FOLLOWING_DOC_ID, variables=json.dumps(variables, separators=(',', ':')))
-        target_url = f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}/?{urlencode(query_dict, quote_via=quote)}"
+        target_url = self.get_following_hashtags_url()
         idx = search_request(self.json_requests, target_url, JsonResponseContentType.application_json)
         if idx is None:
             logger.warning(f"Following hashtags number not found for user '{self.username}'.")
+            skip_caching()
             return 0
         request = self.json_requests.pop(idx)
         json_data = get_json_data(request.response)
@@ -82,8 +95,11 @@ class CollectUserInfo(UserIDRequiredCollect):
 
         is_private_account = self.get_user_id()
 
-        following_hashtags_number = 0
-        if not is_private_account:
+        # None tells apart the hashtags not being counted from a real zero
+        following_hashtags_number: Optional[int] = None
+        if self.include_following_hashtags and is_private_account:
+            following_hashtags_number = 0
+        elif self.include_following_hashtags:
             del self.driver.requests
             self.load_following_hashtags()
             following_hashtags_number = self.get_following_hashtags_number()
@@ -102,16 +118,25 @@ class CollectUserInfo(UserIDRequiredCollect):
         return result.model_dump(mode="json")
 
 
+@ttl_cache(300)
 @driver_implicit_wait(10)
+@driver_capture_scopes(API_CAPTURE_SCOPES)
 def collect_user_info(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
-                      username: str) -> Json:
+                      username: str,
+                      include_following_hashtags: bool = True) -> Json:
     """Collect user information through `username`, including `user_id`, `username`,
     `profile_pic_url`, `biography`, `post_count`, `follower_count`, `following_count`.
+    The result is cached for 5 minutes, use `collect_user_info.invalidate(username)`
+    to drop it earlier.
 
     Args:
         driver (selenium.webdriver.remote.webdriver.WebDriver): selenium
          driver for controlling the browser to perform certain actions.
         username (str): name of the user.
+        include_following_hashtags (bool): whether to count the hashtags followed by
+         the user. Counting them needs to open the followings dialog, which takes
+         about as long as loading the profile. If it's set to False,
+         `following_tag_count` is None.
 
     Returns:
         Json: user information in json format.
@@ -142,4 +167,4 @@ def collect_user_info(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
           "post_count": 4116,
         }
     """
-    return CollectUserInfo(driver, username).collect()
+    return CollectUserInfo(driver, username, include_following_hashtags).collect()
@@ -1,7 +1,70 @@
+import re
+
 INSTAGRAM_DOMAIN = "https://www.instagram.com"
 GRAPHQL_QUERY_PATH = "graphql/query"
 API_VERSION = "api/v1"
 FOLLOWING_DOC_ID = "17901966028246171"
+# value of `av` in the form data of the graphql requests sent by the logged in browser
+VIEWER_ID = "17841461911219001"
+VIEWER_ID_FORM_FIELD = f"av={VIEWER_ID}".encode()
+# cookie holding the user id of the logged in account
+SESSION_USER_ID_COOKIE = "ds_user_id"
+
+# endpoints of the requests to capture, built once at import time
+GRAPHQL_API_URL = f"{INSTAGRAM_DOMAIN}/api/graphql"
+GRAPHQL_QUERY_URL = f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}"
+FOLLOWERS_URL_FORMAT = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/" + "{user_id}/followers/?{query_str}"
+FOLLOWING_URL_FORMAT = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/" + "{user_id}/following/?{query_str}"
+LIKERS_URL_FORMAT = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/media/" + "{post_id}/likers/"
+MUSIC_CLIPS_URL = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/clips/music/"
+TAG_WEB_INFO_URL_FORMAT = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/tags/web_info/" + "?tag_name={hashtag}"
+
+# url patterns of the requests captured by selenium-wire while collecting, all the
+# other requests (images, videos, scripts, analytics) pass the proxy without being stored
+API_CAPTURE_SCOPES = [re.escape(f"{INSTAGRAM_DOMAIN}/") + f"({API_VERSION}/|api/graphql|{GRAPHQL_QUERY_PATH})"]
+
+# xpaths and css selectors of the page elements to interact with
+FOLLOWERS_BTN_XPATH_FORMAT = "//a[@href='/{username}/followers/'][@role='link']"
+FOLLOWING_BTN_XPATH_FORMAT = "//a[@href='/{username}/following/'][@role='link']"
+HASHTAGS_TAB_XPATH = "//span[text()='Hashtags']"
+LIKES_BTN_XPATH_FORMAT = "//a[@href='/p/{post_code}/liked_by/'][@role='link']"
+POST_ID_META_CSS_SELECTOR = 'meta[property="al:ios:url"]'
+USERS_DIALOG_BOTTOM_XPATH = "//div[@class='_aano']//div[@role='progressbar']"
+SEARCH_BTN_XPATH = '//a[@href="#"][@role="link"]'
+SEARCH_INPUT_XPATH = ('//input'
+                      '[@aria-label="Search input" or @aria-label="Sucheingabe"]'
+                      '[@placeholder="Search" or @placeholder="Suchen"]'
+                      '[@type="text"]')
+NOT_PERSONALISED_BTN_XPATH = ('//div[@aria-label="Not personalised" '
+                              'or @aria-label="Not personalized" '
+                              'or @aria-label="Nicht personalisiert"]'
+                              '[@role="button"][@tabindex="0"]'
+                              '//span[text()="Not personalised" '
+                              'or text()="Not personalized" '
+                              'or text()="Nicht personalisiert"]')
+# the permalinks of the comments of a post, i.e. its timestamps, which link to
+# `/p/{post_code}/c/{comment_id}/`, unlike the generated classes of the page
+COMMENT_LINKS_CSS_SELECTOR_FORMAT = 'a[href*="/{post_code}/c/"]'
+DECLINE_OPTIONAL_COOKIES_BTN_XPATH = ('//button[@tabindex="0"]'
+                                      '[text()="Decline optional cookies" '
+                                      'or text()="Optionale Cookies ablehnen"]')
+NOT_NOW_NOTIFICATIONS_BTN_XPATH = ('//button[@tabindex="0"]'
+                                   '[text()="Not Now" '
+                                   'or text()="Jetzt nicht"]')
+
+# scripts run in the browser, each one of them replaces several WebDriver commands
+# returns the content of the first json script tag containing arguments[0], or null
+FIND_JSON_SCRIPT_JS = """
+for (const script of document.querySelectorAll('script[type="application/json"]')) {
+    if (script.innerHTML.includes(arguments[0])) return script.innerHTML;
+}
+return null;
+"""
+# scrolls the last element matching the css selector arguments[0] into view
+SCROLL_LAST_INTO_VIEW_JS = """
+const nodes = document.querySelectorAll(arguments[0]);
+if (nodes.length) nodes[nodes.length - 1].scrollIntoView(true);
+"""
 
 
 class JsonResponseContentType:
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Union, Optional
 from .schemas import (
     UserProfile, Usertag, Location, Caption, Post, MusicBasicInfo
 )
@@ -260,12 +260,14 @@ def extract_post(post_info_dict: Dict[str, Any]) -> Post:
     return post
 
 
-def create_users_list(json_data_list: List[Dict[str, Any]], key: str = "users"):
+def create_users_list(json_data_list: List[Dict[str, Any]], key: str = "users", n: Optional[int] = None):
     """Create a list of users from the given json data list.
 
     Args:
         json_data_list (List[Dict[str, Any]]): The list of json data.
         key (str): The key to extract from the json data. Default is "users".
+        n (Optional[int]): The maximum number of users to create, the users beyond
+         it are skipped without being created. Default is None, i.e. all users.
 
     Returns:
         List[UserProfile]: The list of users.
@@ -276,9 +278,12 @@ def create_users_list(json_data_list: List[Dict[str, Any]], key: str = "users"):
         [UserProfile(id=123, username="username", fullname="fullname", profile_pic_url="https://example.com",
         is_private=False, is_verified=True)]
     """
-    users = []
+    users: List[UserProfile] = []
     for json_data in json_data_list:
-        for user_info in json_data[key]:
+        if n is not None and len(users) >= n:
+            break
+        user_infos = json_data[key] if n is None else json_data[key][:n - len(users)]
+        for user_info in user_infos:
             user = UserProfile(id=extract_id(user_info),
                                username=user_info.get("username", ""),
                                fullname=user_info.get("full_name", ""),
@@ -1,4 +1,14 @@
+import copy
+import inspect
+import threading
+from concurrent.futures import Future
 from functools import wraps
+from typing import Dict, Hashable, List, Tuple
+from .cache import TTLCache
+from .utils import get_viewer_id
+
+# per thread flag telling `ttl_cache` not to cache the result being collected
+_caching_state = threading.local()
 
 
 def driver_implicit_wait(seconds: int = 10):
@@ -23,3 +33,133 @@ def driver_implicit_wait(seconds: int = 10):
             return func(driver, *args, **kwargs)
         return wrapped_function
     return driver_implicit_wait_decorator
+
+
+def driver_capture_scopes(scopes: List[str]):
+    """Decorator to let the driver only capture the requests matching the given
+    url patterns while executing the function. The previous scopes of the driver
+    are restored afterwards.
+
+    Selenium-wire stores every request passing its proxy together with the
+    response body, limiting the scopes keeps the proxy fast and the list of
+    captured requests short.
+
+    Args:
+        scopes (List[str]): regular expressions of the urls to capture.
+
+    Returns:
+        function: The wrapped function
+
+    Examples:
+        >>> # Only capture the api requests of instagram while executing the function
+        >>> @driver_capture_scopes([r"https://www\\.instagram\\.com/api/"])
+        ... def test_function(chrome_driver):
+        ...     pass
+    """
+    def driver_capture_scopes_decorator(func):
+        @wraps(func)
+        def wrapped_function(driver, *args, **kwargs):
+            previous_scopes = driver.scopes
+            driver.scopes = scopes
+            try:
+                return func(driver, *args, **kwargs)
+            finally:
+                driver.scopes = previous_scopes
+        return wrapped_function
+    return driver_capture_scopes_decorator
+
+
+def skip_caching() -> None:
+    """Keep the result of the collecting function running on this thread out of
+    the cache of `ttl_cache`, e.g. because a response wasn't captured in time and
+    the result is empty or incomplete. The next call collects it again.
+
+    Examples:
+        >>> from crawlinsta.decorators import skip_caching
+        >>> skip_caching()
+    """
+    _caching_state.skip = True
+
+
+def ttl_cache(ttl: float = 300, maxsize: int = 128):
+    """Decorator to cache the result of a collecting function for `ttl` seconds.
+
+    The cache key consists of all the arguments except the driver, followed by the
+    user id of the account logged in with the driver, since what is visible depends
+    on the account. So the same target collected by another driver logged in with
+    the same account is served from the cache as well. Each
+    caller gets its own copy of the cached result. Errors are not cached, neither
+    are the results of calls, which invoked `skip_caching`, e.g. because a
+    response wasn't captured in time.
+    Concurrent calls with the same arguments, e.g. from `collect_in_parallel`,
+    are collected only once, the later callers wait for the result or the error
+    of the first one.
+    The wrapped function gets the attributes `invalidate` to remove the entries
+    starting with the given arguments, e.g. a username, and `cache_clear` to
+    remove all the entries.
+
+    Args:
+        ttl (float, optional): The number of seconds a result is kept. Defaults to 300.
+        maxsize (int, optional): The maximum number of results kept. Defaults to 128.
+
+    Returns:
+        function: The wrapped function
+
+    Examples:
+        >>> # Keep the collected result for 5 minutes
+        >>> @ttl_cache(300)
+        ... def test_function(chrome_driver, username):
+        ...     pass
+        >>> test_function.invalidate("instagram_username")
+    """
+    def ttl_cache_decorator(func):
+        cache = TTLCache(ttl, maxsize)
+        signature = inspect.signature(func)
+        inflight: Dict[Tuple[Hashable, ...], Future] = {}
+        inflight_lock = threading.Lock()
+
+        @wraps(func)
+        def wrapped_function(driver, *args, **kwargs):
+            bound_arguments = signature.bind(driver, *args, **kwargs)
+            bound_arguments.apply_defaults()
+            # the viewer comes last, so that the entries can still be invalidated by the arguments
+            key = tuple(bound_arguments.arguments.values())[1:] + (get_viewer_id(driver),)
+            result = cache.get(key)
+            if result is not None:
+                return copy.deepcopy(result)
+
+            with inflight_lock:
+                # the result may have been stored since the first look-up, it's stored
+                # before the call is removed from `inflight`
+                result = cache.get(key)
+                if result is not None:
+                    return copy.deepcopy(result)
+                future = inflight.get(key)
+                is_first_call = future is None
+                if is_first_call:
+                    future = inflight[key] = Future()
+            if not is_first_call:
+                # the same collecting is running already, share its result or error
+                return copy.deepcopy(future.result())
+
+            outer_skip = getattr(_caching_state, "skip", False)
+            _caching_state.skip = False
+            try:
+                result = func(driver, *args, **kwargs)
+                if not _caching_state.skip:
+                    cache.set(key, result)
+                future.set_result(result)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                # an incomplete inner result makes the outer result incomplete too
+                _caching_state.skip = outer_skip or _caching_state.skip
+                with inflight_lock:
+                    inflight.pop(key, None)
+            return copy.deepcopy(result)
+
+        wrapped_function.invalidate = cache.invalidate  # type: ignore
+        wrapped_function.cache_clear = cache.clear  # type: ignore
+        return wrapped_function
+    return ttl_cache_decorator
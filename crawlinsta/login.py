@@ -5,6 +5,7 @@ from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
 from typing import Union
+from .constants import DECLINE_OPTIONAL_COOKIES_BTN_XPATH, NOT_NOW_NOTIFICATIONS_BTN_XPATH
 
 __all__ = [
     "login",
@@ -46,10 +47,7 @@ def login(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
     time.sleep(5)
 
     try:
-        decline_optional_cookies_btn_xpath = ('//button[@tabindex="0"]'
-                                              '[text()="Decline optional cookies" '
-                                              'or text()="Optionale Cookies ablehnen"]')
-        decline_optional_cookies_btn = driver.find_element(By.XPATH, decline_optional_cookies_btn_xpath)
+        decline_optional_cookies_btn = driver.find_element(By.XPATH, DECLINE_OPTIONAL_COOKIES_BTN_XPATH)
         decline_optional_cookies_btn.click()
         time.sleep(3)
     except NoSuchElementException:
@@ -72,10 +70,7 @@ def login(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
     joblib.dump(driver.get_cookies(), cookies_path)
 
     try:
-        not_turn_on_notifications_btn_xpath = ('//button[@tabindex="0"]'
-                                               '[text()="Not Now" '
-                                               'or text()="Jetzt nicht"]')
-        not_turn_on_notifications_btn = driver.find_element(By.XPATH, not_turn_on_notifications_btn_xpath)
+        not_turn_on_notifications_btn = driver.find_element(By.XPATH, NOT_NOW_NOTIFICATIONS_BTN_XPATH)
         not_turn_on_notifications_btn.click()
     except NoSuchElementException:
         logger.error("Notifications popup not found")
@@ -103,10 +98,7 @@ def login_with_cookies(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
     driver.get('https://www.instagram.com/')
 
     try:
-        decline_optional_cookies_btn_xpath = ('//button[@tabindex="0"]'
-                                              '[text()="Decline optional cookies" '
-                                              'or text()="Optionale Cookies ablehnen"]')
-        decline_optional_cookies_btn = driver.find_element(By.XPATH, decline_optional_cookies_btn_xpath)
+        decline_optional_cookies_btn = driver.find_element(By.XPATH, DECLINE_OPTIONAL_COOKIES_BTN_XPATH)
         decline_optional_cookies_btn.click()
     except NoSuchElementException:
         logger.error("Optional cookies popup not found")
@@ -118,10 +110,7 @@ def login_with_cookies(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
     time.sleep(5)  # Example: Wait for the page to load after setting cookies
 
     try:
-        not_turn_on_notifications_btn_xpath = ('//button[@tabindex="0"]'
-                                               '[text()="Not Now" '
-                                               'or text()="Jetzt nicht"]')
-        not_turn_on_notifications_btn = driver.find_element(By.XPATH, not_turn_on_notifications_btn_xpath)
+        not_turn_on_notifications_btn = driver.find_element(By.XPATH, NOT_NOW_NOTIFICATIONS_BTN_XPATH)
         not_turn_on_notifications_btn.click()
     except NoSuchElementException:
         logger.error("Notifications popup not found")
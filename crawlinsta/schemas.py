@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Union
+from typing import ClassVar, FrozenSet, List, Optional, Union
 import typing_extensions
 
 
@@ -10,24 +10,33 @@ class PreferDefaultsModel(BaseModel):
     rather than omitting it.
     """
 
+    __nullable_fields__: ClassVar[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        """
+        Collects the names of the fields allowing None once per model class, instead of
+        inspecting the field annotations again for every passed value of every instance.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__nullable_fields__ = frozenset(name for name, field in cls.model_fields.items()
+                                            if type(None) in typing_extensions.get_args(field.annotation))
+
     def _field_allows_none(self, field_name):
         """
         Returns True if the field is exists in the model's __fields__ and it's allow_none property is True.
         Returns False otherwise.
         """
-        field = self.model_fields.get(field_name)
-        if field is None:
-            return False
-        allow_none = type(None) in typing_extensions.get_args(field.annotation)
-        return allow_none
+        return field_name in self.__nullable_fields__
 
     def __init__(self, **data):
         """
         Removes any fields from the data which are None and are not allowed to be None.
         The results are then passed to the super class's init method.
         """
+        nullable_fields = self.__nullable_fields__
         data_without_null_fields = {k: v for k, v in data.items() if (
-            v is not None or self._field_allows_none(k)
+            v is not None or k in nullable_fields
         )}
         super().__init__(**data_without_null_fields)
 
@@ -78,9 +87,10 @@ class UserEngagementInfo(PreferDefaultsModel):
     following_count: int = Field(0,
                                  description="Number of the following.",
                                  examples=[10])
-    following_tag_count: int = Field(0,
-                                     description="Number of the tags, which are followed by the user.",
-                                     examples=[0])
+    following_tag_count: Optional[int] = Field(0,
+                                               description="Number of the tags, which are followed by the user. "
+                                                           "It's None if the tags aren't counted.",
+                                               examples=[0])
     post_count: int = Field(0,
                             description="Number of the posts of the user.",
                             examples=[20])
@@ -1,13 +1,29 @@
+import copy
 import json
 import logging
+import random
+import time
+from functools import lru_cache
+from pydantic import BaseModel
+from urllib.parse import unquote_plus
 from seleniumwire.utils import decode
 from seleniumwire.request import Request, Response
-from typing import List, Callable, Optional, Dict, Any, Tuple, Union
-from .constants import JsonResponseContentType
+from seleniumwire.webdriver import Chrome, Edge, Firefox, Safari, Remote
+from typing import List, Callable, Optional, Dict, Any, Tuple, Type, Union, Set
+from .constants import JsonResponseContentType, SESSION_USER_ID_COOKIE
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 logger = logging.getLogger("crawlinsta")
 
+# the pauses only need to look irregular, a single pseudo random generator
+# avoids reading from the os entropy source for each one of them
+_RNG = random.Random()
+
 
 def filter_requests(requests: List[Request],
                     response_content_type: str = JsonResponseContentType.application_json) -> List[Request]:
@@ -36,12 +52,46 @@ def filter_requests(requests: List[Request],
     for request in requests:
         if not request.response:
             continue
-        elif request.response.headers['Content-Type'] != response_content_type:
+        elif request.response.headers.get('Content-Type') != response_content_type:
             continue
         result.append(request)
     return result
 
 
+def _match_request(request: Request,
+                   request_url: str,
+                   response_content_type: Optional[str],
+                   additional_search_func: Optional[Callable],
+                   *args, **kwargs) -> bool:
+    """Check if the request matches, without logging anything."""
+    if request.url != request_url:
+        return False
+    elif not request.response:
+        return False
+    # the headers are looked up case-insensitively by scanning all of them, so the
+    # content type is looked up only once
+    content_type = request.response.headers.get('Content-Type')
+    if content_type is None:
+        return False
+    elif response_content_type and content_type != response_content_type:
+        return False
+    elif additional_search_func and not additional_search_func(request, *args, **kwargs):
+        return False
+    return True
+
+
+def _find_request(requests: List[Request],
+                  request_url: str,
+                  response_content_type: Optional[str],
+                  additional_search_func: Optional[Callable],
+                  *args, **kwargs) -> Union[int, None]:
+    """Find the index of the first matching request, without logging anything."""
+    for i, request in enumerate(requests):
+        if _match_request(request, request_url, response_content_type, additional_search_func, *args, **kwargs):
+            return i
+    return None
+
+
 def search_request(requests: List[Request],
                    request_url: str,
                    response_content_type: Optional[str] = JsonResponseContentType.application_json,
@@ -72,20 +122,246 @@ def search_request(requests: List[Request],
     if not requests:
         logger.error("No requests to search.")
         return None
-    for i, request in enumerate(requests):
-        if request.url != request_url:
-            continue
-        elif not request.response:
-            continue
-        elif 'Content-Type' not in request.response.headers:
-            continue
-        elif response_content_type and request.response.headers['Content-Type'] != response_content_type:
-            continue
-        elif additional_search_func and not additional_search_func(request, *args, **kwargs):
+    idx = _find_request(requests, request_url, response_content_type, additional_search_func, *args, **kwargs)
+    if idx is None:
+        logger.error(f"No response with content-type [{response_content_type}] to the url '{request_url}' found.")
+    return idx
+
+
+def random_seconds(min_seconds: int, max_seconds: int) -> int:
+    """Get a random whole number of seconds between `min_seconds` and `max_seconds`,
+    both included, to pause like a human user.
+
+    Args:
+        min_seconds (int): The minimum number of seconds.
+        max_seconds (int): The maximum number of seconds.
+
+    Returns:
+        int: The random number of seconds.
+
+    Examples:
+        >>> from crawlinsta.utils import random_seconds
+        >>> random_seconds(4, 6)
+        5
+    """
+    return _RNG.randint(min_seconds, max_seconds)
+
+
+def get_viewer_id(driver: Union[Chrome, Edge, Firefox, Safari, Remote]) -> Optional[str]:
+    """Get the user id of the account logged in with the driver. What is visible,
+    e.g. the posts of a private account, depends on it.
+
+    Args:
+        driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium driver.
+
+    Returns:
+        Optional[str]: The user id of the logged in account, None if not logged in.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> from crawlinsta.login import login_with_cookies
+        >>> from crawlinsta.utils import get_viewer_id
+        >>> driver = webdriver.Chrome()
+        >>> login_with_cookies(driver)
+        >>> get_viewer_id(driver)
+        '1234567890'
+    """
+    cookie = driver.get_cookie(SESSION_USER_ID_COOKIE)
+    return cookie.get("value") if cookie else None
+
+
+def _wait_for_matching_request(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                               request_url: str,
+                               response_content_type: Optional[str],
+                               additional_search_func: Optional[Callable],
+                               *args,
+                               timeout: float,
+                               poll_frequency: float,
+                               **kwargs) -> Tuple[List[Request], Optional[Request]]:
+    """Wait until the response to the request is captured, see `wait_for_request`.
+
+    Returns:
+        Tuple[List[Request], Optional[Request]]: The requests captured at the end of
+        waiting and the awaited request, which is None if the timeout is reached.
+    """
+    deadline = time.monotonic() + timeout
+    requests: List[Request] = []
+    # ids of the requests with a response, which didn't match in a previous check,
+    # they are skipped instead of being parsed again in each check
+    checked_ids: Set[Any] = set()
+    while True:
+        requests = driver.requests
+        for request in requests:
+            if request.id in checked_ids:
+                continue
+            if _match_request(request, request_url, response_content_type,
+                              additional_search_func, *args, **kwargs):
+                return requests, request
+            if request.response and request.id is not None:
+                checked_ids.add(request.id)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(poll_frequency, remaining))
+    logger.warning(f"Timed out after {timeout} seconds waiting for the response to the url '{request_url}'.")
+    return requests, None
+
+
+def wait_for_request(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                     request_url: str,
+                     response_content_type: Optional[str] = JsonResponseContentType.application_json,
+                     additional_search_func: Optional[Callable] = None,
+                     *args,
+                     timeout: float = 10,
+                     poll_frequency: float = 0.5,
+                     **kwargs) -> List[Request]:
+    """Wait until the response to the request is captured by the driver, instead
+    of sleeping for a fixed time after each action. It returns as soon as the
+    response is there, which is usually much earlier than the fixed sleep.
+
+    The captured requests are returned, so that the caller doesn't need to load
+    them from the driver once more.
+
+    Args:
+        driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium driver
+         capturing the requests.
+        request_url (str): The url to wait for.
+        response_content_type (Optional[str]): The content type of the response.
+        additional_search_func (callable): Additional search function to apply.
+        timeout (float): The maximum number of seconds to wait.
+        poll_frequency (float): The number of seconds between two checks.
+
+    Returns:
+        List[Request]: The requests captured at the end of waiting. The awaited request
+        is among them, unless the timeout is reached.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> driver = webdriver.Chrome()
+        >>> driver.get("https://www.instagram.com")
+        >>> from crawlinsta.utils import wait_for_request
+        >>> requests = wait_for_request(driver, "https://www.instagram.com/api/graphql",
+        ...                             "text/javascript; charset=utf-8")
+    """
+    return _wait_for_matching_request(driver, request_url, response_content_type, additional_search_func,
+                                      *args, timeout=timeout, poll_frequency=poll_frequency, **kwargs)[0]
+
+
+def wait_for_matching_request(driver: Union[Chrome, Edge, Firefox, Safari, Remote],
+                              request_url: str,
+                              response_content_type: Optional[str] = JsonResponseContentType.application_json,
+                              additional_search_func: Optional[Callable] = None,
+                              *args,
+                              timeout: float = 10,
+                              poll_frequency: float = 0.5,
+                              **kwargs) -> Optional[Request]:
+    """Wait until the response to the request is captured by the driver, same as
+    `wait_for_request`, but return the awaited request itself instead of all the
+    captured requests, for callers interested in this single request only.
+
+    Args:
+        driver (Union[Chrome, Edge, Firefox, Safari, Remote]): selenium driver
+         capturing the requests.
+        request_url (str): The url to wait for.
+        response_content_type (Optional[str]): The content type of the response.
+        additional_search_func (callable): Additional search function to apply.
+        timeout (float): The maximum number of seconds to wait.
+        poll_frequency (float): The number of seconds between two checks.
+
+    Returns:
+        Optional[Request]: The awaited request, None if the timeout is reached.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> driver = webdriver.Chrome()
+        >>> driver.get("https://www.instagram.com/static/images/ico/favicon.ico")
+        >>> from crawlinsta.utils import wait_for_matching_request
+        >>> request = wait_for_matching_request(driver, "https://www.instagram.com/static/images/ico/favicon.ico",
+        ...                                     response_content_type=None)
+    """
+    return _wait_for_matching_request(driver, request_url, response_content_type, additional_search_func,
+                                      *args, timeout=timeout, poll_frequency=poll_frequency, **kwargs)[1]
+
+
+def parse_form_data(body: bytes) -> Dict[str, List[str]]:
+    """Parse the url-encoded form data of a request body, same as `urllib.parse.parse_qs`.
+
+    The bodies of the graphql requests are flat forms with a few dozens of fields,
+    most of them without any escaped character. Only the values containing escaped
+    characters are unquoted, which makes it about twice as fast as `parse_qs`.
+
+    Args:
+        body (bytes): The url-encoded request body.
+
+    Returns:
+        Dict[str, List[str]]: The values of each field, fields with blank values are omitted.
+
+    Examples:
+        >>> from crawlinsta.utils import parse_form_data
+        >>> parse_form_data(b"av=123&variables=%7B%7D")
+        {'av': ['123'], 'variables': ['{}']}
+    """
+    form_data: Dict[str, List[str]] = {}
+    for field in body.decode().split("&"):
+        name, _, value = field.partition("=")
+        if not value:
             continue
-        return i
-    logger.error(f"No response with content-type [{response_content_type}] to the url '{request_url}' found.")
-    return None
+        if "%" in name or "+" in name:
+            name = unquote_plus(name)
+        if "%" in value or "+" in value:
+            value = unquote_plus(value)
+        form_data.setdefault(name, []).append(value)
+    return form_data
+
+
+def get_request_data(request: Request) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+    """Get the form data of the request together with the json `variables` in it.
+
+    The same request is usually checked several times, e.g. while waiting for it
+    and while searching for it afterward, so the body is only parsed at the first
+    call and the parsed data is kept on the request.
+
+    Args:
+        request (:obj:`seleniumwire.request.Request`): The request object.
+
+    Returns:
+        Tuple[Dict[str, List[str]], Dict[str, Any]]: The form data and the json `variables`.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> driver = webdriver.Chrome()
+        >>> driver.get("https://www.instagram.com")
+        >>> from crawlinsta.utils import get_request_data
+        >>> request_data, variables = get_request_data(driver.requests[0])
+    """
+    parsed_data = vars(request).get("_parsed_data")
+    if parsed_data is None:
+        request_data = parse_form_data(request.body)
+        variables = load_json(request_data.get("variables", ["{}"])[0])
+        parsed_data = (request_data, variables)
+        setattr(request, "_parsed_data", parsed_data)
+    return parsed_data
+
+
+def load_json(data: Union[str, bytes]) -> Any:
+    """Deserialize the json document. If `orjson` is installed, it's used for
+    parsing, which is several times faster than the built-in `json` module for
+    the big responses of instagram.
+
+    Args:
+        data (Union[str, bytes]): The json document.
+
+    Returns:
+        Any: The deserialized object.
+
+    Examples:
+        >>> from crawlinsta.utils import load_json
+        >>> load_json(b'{"users": []}')
+        {'users': []}
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def get_json_data(response: Response) -> Dict[str, Any]:
@@ -106,10 +382,37 @@ def get_json_data(response: Response) -> Dict[str, Any]:
     """
     data = decode(response.body,
                   response.headers.get('Content-Encoding', 'identity'))
-    data = json.loads(data)
+    data = load_json(data)
     return data
 
 
+@lru_cache(maxsize=None)
+def _dump_default_model(model_class: Type[BaseModel]) -> Dict[str, Any]:
+    """Dump the default instance of the given model class once and keep it."""
+    return model_class().model_dump(mode="json")
+
+
+def get_default_result(model_class: Type[BaseModel]) -> Dict[str, Any]:
+    """Get the json dump of the model class built with its default values.
+
+    The dump is only computed the first time for each model class, afterward
+    a copy of the cached dump is returned, so the caller can modify it freely.
+
+    Args:
+        model_class (Type[BaseModel]): model class, all fields of which have default values.
+
+    Returns:
+        Dict[str, Any]: The json dump of the default instance.
+
+    Examples:
+        >>> from crawlinsta.schemas import Users
+        >>> from crawlinsta.utils import get_default_result
+        >>> get_default_result(Users)
+        {'users': [], 'count': 0}
+    """
+    return copy.deepcopy(_dump_default_model(model_class))
+
+
 def get_media_type(media_type: int, product_type: str) -> str:
     """Determine the media type based on the provided media type and product type.
 
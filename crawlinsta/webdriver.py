@@ -25,6 +25,75 @@ from selenium.webdriver.wpewebkit.options import Options as WPEWebKitOptions  #
 from selenium.webdriver.wpewebkit.service import Service as WPEWebKitService  # noqa
 from selenium.webdriver.wpewebkit.webdriver import WebDriver as WPEWebKit  # noqa
 from selenium.webdriver import __version__  # noqa
+from typing import Any, Dict
+
+# selenium-wire options making the proxy cheaper for crawling
+SELENIUMWIRE_OPTIONS: Dict[str, Any] = {
+    # keep the captured requests in memory instead of pickling each of them to disk,
+    # which makes both the proxy and every access of `driver.requests` faster.
+    "request_storage": "memory",
+    # the oldest captured requests are dropped first, when the limit is reached.
+    "request_storage_max_size": 500,
+    # keep multiplexing the requests to instagram over one HTTP/2 connection.
+    "mitm_http2": True,
+    # ask for uncompressed responses, so the captured json bodies don't need to be
+    # decompressed before parsing them.
+    "disable_encoding": True,
+    # the CDN hosts of the images and videos must not be excluded from the proxy,
+    # `download_media` reads the media from their captured responses.
+}
+
+
+def get_seleniumwire_options(**options: Any) -> Dict[str, Any]:
+    """Get the selenium-wire options for creating a browser driver, the given
+    options override the defaults in `SELENIUMWIRE_OPTIONS`.
+
+    Args:
+        **options (Any): selenium-wire options, e.g. `proxy` or `request_storage_max_size`.
+
+    Returns:
+        Dict[str, Any]: selenium-wire options.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> driver = webdriver.Chrome(seleniumwire_options=webdriver.get_seleniumwire_options())
+    """
+    return {**SELENIUMWIRE_OPTIONS, **options}
+
+
+# chrome preferences for crawling the json responses only
+CHROME_PREFS: Dict[str, Any] = {
+    # the images aren't needed for collecting, only the json responses of the api are
+    # read. The scripts and stylesheets are still loaded, the page needs them to send
+    # the api requests and to show the buttons clicked while collecting.
+    "profile.managed_default_content_settings.images": 2,
+}
+
+
+def get_chrome_options(**prefs: Any) -> ChromeOptions:
+    """Get the chrome options for creating a browser driver, which doesn't load
+    the images of the pages, the given preferences override the defaults in
+    `CHROME_PREFS`.
+
+    The images are blocked for the whole browser, so a driver created with these
+    options shouldn't be used for `download_media`.
+
+    Args:
+        **prefs (Any): chrome preferences, e.g.
+         `**{"profile.managed_default_content_settings.images": 1}` to load the images again.
+
+    Returns:
+        ChromeOptions: chrome options.
+
+    Examples:
+        >>> from crawlinsta import webdriver
+        >>> driver = webdriver.Chrome(options=webdriver.get_chrome_options(),
+        ...                           seleniumwire_options=webdriver.get_seleniumwire_options())
+    """
+    options = ChromeOptions()
+    options.add_experimental_option("prefs", {**CHROME_PREFS, **prefs})
+    return options
+
 
 # We need an explicit __all__ because the above won't otherwise be exported.
 __all__ = [
@@ -53,4 +122,8 @@ __all__ = [
     "ActionChains",
     "Proxy",
     "Keys",
+    "SELENIUMWIRE_OPTIONS",
+    "get_seleniumwire_options",
+    "CHROME_PREFS",
+    "get_chrome_options",
 ]
@@ -0,0 +1,31 @@
+import pytest
+from crawlinsta import cache
+
+
+class FakeClock:
+    """Clock of `crawlinsta.utils`, which only moves forward when sleeping, so
+    that waiting for a request takes no time in the tests."""
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    cache.clear_all()
+    yield
+    cache.clear_all()
+
+
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr("crawlinsta.utils.time", fake_clock)
+    return fake_clock
@@ -0,0 +1,69 @@
+from unittest import mock
+from crawlinsta.cache import TTLCache, invalidate, clear_all
+
+
+def test_ttl_cache_get_set():
+    cache = TTLCache(ttl=10, maxsize=2)
+    assert cache.get(("user1",)) is None
+    assert cache.get(("user1",), "default") == "default"
+
+    cache.set(("user1",), {"id": "1"})
+    assert cache.get(("user1",)) == {"id": "1"}
+    assert ("user1",) in cache
+    assert ("user2",) not in cache
+
+
+@mock.patch("crawlinsta.cache.time.monotonic")
+def test_ttl_cache_expired(mocked_monotonic):
+    mocked_monotonic.return_value = 100
+    cache = TTLCache(ttl=10)
+    cache.set(("user1",), {"id": "1"})
+
+    mocked_monotonic.return_value = 109
+    assert cache.get(("user1",)) == {"id": "1"}
+
+    mocked_monotonic.return_value = 110
+    assert cache.get(("user1",)) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_maxsize():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set(("user1",), 1)
+    cache.set(("user2",), 2)
+    cache.get(("user1",))
+    cache.set(("user3",), 3)
+
+    assert len(cache) == 2
+    assert ("user1",) in cache
+    assert ("user2",) not in cache
+    assert ("user3",) in cache
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache(ttl=10)
+    cache.set(("user1", 10), 1)
+    cache.set(("user1", 20), 2)
+    cache.set(("user2", 10), 3)
+
+    cache.invalidate("user1")
+    assert len(cache) == 1
+    assert ("user2", 10) in cache
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_invalidate_and_clear_all():
+    cache1 = TTLCache(ttl=10)
+    cache2 = TTLCache(ttl=10)
+    cache1.set(("user1",), 1)
+    cache1.set(("user2",), 2)
+    cache2.set(("user1", "user2"), True)
+
+    invalidate("user1")
+    assert len(cache1) == 1
+    assert len(cache2) == 0
+
+    clear_all()
+    assert len(cache1) == 0
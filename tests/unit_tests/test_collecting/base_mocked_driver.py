@@ -1,6 +1,11 @@
 class BaseMockedDriver:
     def __init__(self):
         self.requests = []
+        self.scopes = []
+        self.current_url = ""
+
+    def get_cookie(self, name):
+        return None
 
     def implicitly_wait(self, seconds):
         pass
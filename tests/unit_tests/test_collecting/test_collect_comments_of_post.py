@@ -13,23 +13,22 @@ from .base_mocked_driver import BaseMockedDriver
 class MockedDriverCached(BaseMockedDriver):
     def __init__(self, post_id="3275298868401088037"):
         self.requests = []
-        self.call_find_element_number = 0
+        self.call_execute_script_number = 0
         self.post_id = post_id
         super().__init__()
 
-    def find_elements(self, by, value):
-        if not self.call_find_element_number:
-            scripts = []
+    def execute_script(self, script, *args):
+        if not self.call_execute_script_number:
             with open("tests/resources/comments/C10MvewSSYl.html", "r") as file:
                 content = html.fromstring(file.read())
             script_elements = content.xpath('//script[@type="application/json"]')
+            self.call_execute_script_number += 1
             for script_element in script_elements:
-                script = mock.Mock(get_attribute=mock.Mock(return_value=script_element.text_content()))
-                scripts.append(script)
-            self.call_find_element_number += 1
-            return scripts
+                if args[0] in script_element.text_content():
+                    return script_element.text_content()
+            return None
         url = f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}"
-        with open(f"tests/resources/comments/comments_cached{self.call_find_element_number}.json", "r") as file:
+        with open(f"tests/resources/comments/comments_cached{self.call_execute_script_number}.json", "r") as file:
             data = json.load(file)
         response = mock.Mock(headers={"Content-Type": JsonResponseContentType.application_json,
                                       'Content-Encoding': 'identity'},
@@ -40,8 +39,7 @@ class MockedDriverCached(BaseMockedDriver):
                                                            separators=(',', ':'))),
                                  quote_via=quote).encode()
         self.requests = [request]
-        self.call_find_element_number += 1
-        return [mock.Mock()]
+        self.call_execute_script_number += 1
 
     def find_element(self, by, value):
         mocked_element = mock.Mock()
@@ -59,13 +57,13 @@ def test_collect_comments_of_post_success_cached(mocked_sleep):
 
 class MockedDriverLoaded(BaseMockedDriver):
     def __init__(self, post_id="3275298868401088037"):
-        self.call_find_element_number = 0
+        self.call_execute_script_number = 0
         self.post_id = post_id
         super().__init__()
 
     def get(self, url):
         url = f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}"
-        with open(f"tests/resources/comments/comments_load{self.call_find_element_number}.json", "r") as file:
+        with open(f"tests/resources/comments/comments_load{self.call_execute_script_number}.json", "r") as file:
             data = json.load(file)
         response = mock.Mock(headers={"Content-Type": JsonResponseContentType.application_json,
                                       'Content-Encoding': 'identity'},
@@ -77,12 +75,12 @@ class MockedDriverLoaded(BaseMockedDriver):
                                  quote_via=quote).encode()
         self.requests = [request]
 
-    def find_elements(self, by, value):
-        if not self.call_find_element_number:
-            self.call_find_element_number += 1
-            return []
+    def execute_script(self, script, *args):
+        if not self.call_execute_script_number:
+            self.call_execute_script_number += 1
+            return None
         url = f"{INSTAGRAM_DOMAIN}/{GRAPHQL_QUERY_PATH}"
-        with open(f"tests/resources/comments/comments_load{self.call_find_element_number}.json", "r") as file:
+        with open(f"tests/resources/comments/comments_load{self.call_execute_script_number}.json", "r") as file:
             data = json.load(file)
         response = mock.Mock(headers={"Content-Type": JsonResponseContentType.application_json,
                                       'Content-Encoding': 'identity'},
@@ -110,8 +108,7 @@ class MockedDriverLoaded(BaseMockedDriver):
                                                            separators=(',', ':'))),
                                  quote_via=quote).encode()
         self.requests = [request1, request2, request3, request]
-        self.call_find_element_number += 1
-        return [mock.MagicMock()]
+        self.call_execute_script_number += 1
 
     def find_element(self, by, value):
         mocked_element = mock.Mock()
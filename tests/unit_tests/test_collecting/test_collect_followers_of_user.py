@@ -2,15 +2,17 @@ import json
 import pytest
 from unittest import mock
 from urllib.parse import urlencode, quote
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 from crawlinsta.collecting.followers_of_user import collect_followers_of_user
-from crawlinsta.constants import INSTAGRAM_DOMAIN, API_VERSION, JsonResponseContentType
+from crawlinsta.constants import INSTAGRAM_DOMAIN, API_VERSION, GRAPHQL_API_URL, JsonResponseContentType
+from crawlinsta.utils import wait_for_request
 from .base_mocked_driver import BaseMockedDriver
 
 
 class MockedDriver(BaseMockedDriver):
     def __init__(self):
         self.user_id = None
-        self.call_find_element_number = 0
+        self.page_number = 0
         super().__init__()
 
     def get(self, url):
@@ -31,24 +33,31 @@ class MockedDriver(BaseMockedDriver):
 
         self.requests = [request]
 
-    def find_element(self, by, value):
+    def load_next_page(self):
         query_dict = dict(count=12)
-        if self.call_find_element_number:
-            query_dict["max_id"] = 12 * self.call_find_element_number
+        if self.page_number:
+            query_dict["max_id"] = 12 * self.page_number
         query_dict["search_surface"] = "follow_list_page"
         url = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/{self.user_id}/followers/?{urlencode(query_dict, quote_via=quote)}"
         request = mock.Mock()
         request.url = url
 
-        with open(f"tests/resources/followers/followers{self.call_find_element_number + 1}.json", "r") as file:
+        with open(f"tests/resources/followers/followers{self.page_number + 1}.json", "r") as file:
             data = json.load(file)
         request.response = mock.Mock(headers={"Content-Type": JsonResponseContentType.application_json,
                                               'Content-Encoding': 'identity'},
                                      body=json.dumps(data).encode())
         self.requests = [request]
-        self.call_find_element_number += 1
+        self.page_number += 1
+
+    def find_element(self, by, value):
+        if "progressbar" not in value:
+            self.load_next_page()
         return mock.Mock()
 
+    def execute_script(self, script, *args):
+        self.load_next_page()
+
 
 @mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
 def test_collect_followers_of_user(mocked_sleep):
@@ -58,6 +67,166 @@ def test_collect_followers_of_user(mocked_sleep):
     assert result == expected
 
 
+class MockedDriverStaleBottom(MockedDriver):
+    def __init__(self):
+        self.find_bottom_number = 0
+        self.bottom_is_stale = True
+        super().__init__()
+
+    def find_element(self, by, value):
+        if "progressbar" in value:
+            self.find_bottom_number += 1
+        return super().find_element(by, value)
+
+    def execute_script(self, script, *args):
+        if self.bottom_is_stale:
+            self.bottom_is_stale = False
+            raise StaleElementReferenceException()
+        super().execute_script(script, *args)
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_stale_bottom(mocked_sleep):
+    driver = MockedDriverStaleBottom()
+    result = collect_followers_of_user(driver, "marie_2_0", 30)
+    with open("tests/resources/followers/result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+    assert driver.find_bottom_number == 2
+
+
+class MockedDriverEmptyPage(MockedDriver):
+    def load_next_page(self):
+        super().load_next_page()
+        if self.page_number == 2:
+            data = dict(users=[], next_max_id="24", status="ok")
+            self.requests[0].response.body = json.dumps(data).encode()
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_empty_page(mocked_sleep):
+    driver = MockedDriverEmptyPage()
+    result = collect_followers_of_user(driver, "marie_2_0", 30)
+    assert result["count"] == 12
+    assert driver.page_number == 2
+
+
+class MockedDriverLateFirstPage(MockedDriver):
+    def load_next_page(self):
+        # the first page isn't captured before the waiting times out
+        self.requests = []
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_timeout_not_cached(mocked_sleep):
+    result = collect_followers_of_user(MockedDriverLateFirstPage(), "marie_2_0", 30)
+    assert result == {"users": [], "count": 0}
+
+    driver = MockedDriver()
+    result = collect_followers_of_user(driver, "marie_2_0", 30)
+    with open("tests/resources/followers/result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+    assert driver.page_number == 3
+
+
+class MockedDriverHeldBackPage(MockedDriver):
+    def __init__(self):
+        self.held_back = False
+        super().__init__()
+
+    def execute_script(self, script, *args):
+        # the response of the second page is only captured when asking for it again
+        if self.page_number == 1 and not self.held_back:
+            self.held_back = True
+            self.requests = []
+            return
+        super().execute_script(script, *args)
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_held_back_page(mocked_sleep):
+    driver = MockedDriverHeldBackPage()
+    result = collect_followers_of_user(driver, "marie_2_0", 30)
+    with open("tests/resources/followers/result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+    assert driver.held_back
+    mocked_sleep.assert_called_once()
+    assert 20 <= mocked_sleep.call_args.args[0] <= 30
+
+
+class MockedDriverNoProfile(MockedDriver):
+    def get(self, url):
+        self.user_id = "1798450984"
+        self.requests = []
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_cached_profile(mocked_sleep):
+    collect_followers_of_user(MockedDriver(), "marie_2_0", 30)
+    with mock.patch("crawlinsta.collecting.base.wait_for_request",
+                    wraps=wait_for_request) as mocked_wait_for_request:
+        result = collect_followers_of_user(MockedDriverNoProfile(), "marie_2_0", 12)
+    assert result["count"] == 12
+    assert all(call.args[1] != GRAPHQL_API_URL for call in mocked_wait_for_request.call_args_list)
+
+
+class MockedDriverShownProfile(MockedDriver):
+    def __init__(self, current_url):
+        super().__init__()
+        self.user_id = "1798450984"
+        self.current_url = current_url
+        self.get = mock.Mock(wraps=self.get)
+        self.back = mock.Mock(side_effect=self.close_dialog)
+
+    def close_dialog(self):
+        self.current_url = self.current_url.rsplit("/", 2)[0] + "/"
+
+
+@pytest.mark.parametrize("current_url, closed_dialog", [
+    (f"{INSTAGRAM_DOMAIN}/marie_2_0/", False),
+    (f"{INSTAGRAM_DOMAIN}/Marie_2_0", False),
+    (f"{INSTAGRAM_DOMAIN}/marie_2_0/followers/", True),
+    (f"{INSTAGRAM_DOMAIN}/marie_2_0/following/?next=%2F", True),
+])
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_shown_profile(mocked_sleep, current_url, closed_dialog):
+    collect_followers_of_user(MockedDriver(), "marie_2_0", 30)
+    collect_followers_of_user.cache_clear()
+    driver = MockedDriverShownProfile(current_url)
+    result = collect_followers_of_user(driver, "marie_2_0", 30)
+    with open("tests/resources/followers/result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+    driver.get.assert_not_called()
+    assert driver.back.called is closed_dialog
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_other_profile_shown(mocked_sleep):
+    collect_followers_of_user(MockedDriver(), "marie_2_0", 30)
+    collect_followers_of_user.cache_clear()
+    driver = MockedDriverShownProfile(f"{INSTAGRAM_DOMAIN}/marie_2/followers/")
+    collect_followers_of_user(driver, "marie_2_0", 30)
+    driver.get.assert_called_once_with(f"{INSTAGRAM_DOMAIN}/marie_2_0/")
+    driver.back.assert_not_called()
+
+
+@mock.patch("crawlinsta.collecting.base.WebDriverWait")
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_followers_of_user_shown_dialog_not_closed(mocked_sleep, mocked_wait):
+    mocked_wait.return_value.until.side_effect = TimeoutException()
+    collect_followers_of_user(MockedDriver(), "marie_2_0", 30)
+    collect_followers_of_user.cache_clear()
+    driver = MockedDriverShownProfile(f"{INSTAGRAM_DOMAIN}/marie_2_0/followers/")
+    result = collect_followers_of_user(driver, "marie_2_0", 30)
+    with open("tests/resources/followers/result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+    driver.get.assert_called_once_with(f"{INSTAGRAM_DOMAIN}/marie_2_0/")
+
+
 @pytest.mark.parametrize("n", [0, -1])
 def test_collect_followers_of_user_fail(n):
     with pytest.raises(ValueError) as exc_info:
@@ -10,7 +10,7 @@ from .base_mocked_driver import BaseMockedDriver
 class MockedDriver(BaseMockedDriver):
     def __init__(self):
         self.user_id = None
-        self.call_find_element_number = 0
+        self.page_number = 0
         super().__init__()
 
     def get(self, url):
@@ -31,23 +31,30 @@ class MockedDriver(BaseMockedDriver):
 
         self.requests = [request]
 
-    def find_element(self, by, value):
+    def load_next_page(self):
         query_dict = dict(count=12)
-        if self.call_find_element_number:
-            query_dict["max_id"] = 12 * self.call_find_element_number
+        if self.page_number:
+            query_dict["max_id"] = 12 * self.page_number
         url = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/{self.user_id}/following/?{urlencode(query_dict, quote_via=quote)}"
         request = mock.Mock()
         request.url = url
 
-        with open(f"tests/resources/followings/following{self.call_find_element_number + 1}.json", "r") as file:
+        with open(f"tests/resources/followings/following{self.page_number + 1}.json", "r") as file:
             data = json.load(file)
         request.response = mock.Mock(headers={"Content-Type": JsonResponseContentType.application_json,
                                               'Content-Encoding': 'identity'},
                                      body=json.dumps(data).encode())
         self.requests = [request]
-        self.call_find_element_number += 1
+        self.page_number += 1
+
+    def find_element(self, by, value):
+        if "progressbar" not in value:
+            self.load_next_page()
         return mock.Mock()
 
+    def execute_script(self, script, *args):
+        self.load_next_page()
+
 
 @mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
 def test_collect_followings_of_user(mocked_sleep):
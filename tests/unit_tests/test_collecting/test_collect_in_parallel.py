@@ -0,0 +1,40 @@
+import threading
+import pytest
+from crawlinsta.collecting.batch import collect_in_parallel
+from .base_mocked_driver import BaseMockedDriver
+
+
+def test_collect_in_parallel():
+    drivers = [BaseMockedDriver(), BaseMockedDriver()]
+    lock = threading.Lock()
+    drivers_in_use = set()
+    used_drivers = []
+
+    def dummy_collect(driver, username, n):
+        with lock:
+            assert driver not in drivers_in_use
+            drivers_in_use.add(driver)
+            used_drivers.append(driver)
+        with lock:
+            drivers_in_use.remove(driver)
+        return {"username": username, "n": n}
+
+    usernames = ["user1", "user2", "user3", "user4", "user5"]
+    result = collect_in_parallel(drivers, dummy_collect, usernames, n=10)
+
+    assert result == [{"username": username, "n": 10} for username in usernames]
+    assert len(used_drivers) == len(usernames)
+    assert set(used_drivers) <= set(drivers)
+
+
+def test_collect_in_parallel_error():
+    def dummy_collect(driver, username):
+        raise ValueError(f"User '{username}' not found.")
+
+    with pytest.raises(ValueError, match="User 'user1' not found."):
+        collect_in_parallel([BaseMockedDriver()], dummy_collect, ["user1"])
+
+
+def test_collect_in_parallel_no_driver():
+    with pytest.raises(ValueError, match="At least one driver is required for collecting in parallel."):
+        collect_in_parallel([], lambda driver, username: None, ["user1"])
@@ -2,7 +2,7 @@ import json
 import pytest
 from unittest import mock
 from urllib.parse import urlencode, quote
-from crawlinsta.collecting.posts_of_user import collect_posts_of_user
+from crawlinsta.collecting.posts_of_user import collect_posts_of_user, CollectPostsOfUser
 from crawlinsta.constants import INSTAGRAM_DOMAIN, JsonResponseContentType
 from .base_mocked_driver import BaseMockedDriver
 
@@ -110,3 +110,17 @@ def test_collect_posts_of_user_no_posts(mocked_logger, mocked_extract_data, mock
     result = collect_posts_of_user(MockedDriver(), "anasaiaofficial", 30)
     assert result == {"posts": [], "count": 0}
     mocked_logger.warning.assert_called_with("No posts found for user 'anasaiaofficial'.")
+
+
+@pytest.mark.parametrize("cursor, page_info, expected",
+                         [("", {"has_next_page": True, "end_cursor": "abc"}, True),
+                          ("abc", {"has_next_page": True, "end_cursor": "def"}, True),
+                          ("abc", {"has_next_page": True, "end_cursor": "abc"}, False),
+                          ("abc", {"has_next_page": True, "end_cursor": None}, False),
+                          ("abc", {"has_next_page": True}, False),
+                          ("abc", {"has_next_page": False, "end_cursor": "def"}, False)])
+def test_collect_posts_of_user_continue_fetching(cursor, page_info, expected):
+    collector = CollectPostsOfUser(BaseMockedDriver(), "anasaiaofficial", 30)
+    collector.cursor = cursor
+    collector.page_info = page_info
+    assert collector.continue_fetching() is expected
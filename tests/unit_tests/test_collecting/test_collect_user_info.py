@@ -56,6 +56,16 @@ def test_collect_user_info(mocked_sleep):
     }
 
 
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_collect_user_info_without_following_hashtags(mocked_sleep):
+    driver = MockedDriver()
+    driver.find_element = mock.Mock()
+    result = collect_user_info(driver, "nasa", include_following_hashtags=False)
+    assert result["following_tag_count"] is None
+    assert result["follower_count"] == 97956738
+    driver.find_element.assert_not_called()
+
+
 @mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
 def test_collect_user_info_fail(mocked_sleep):
     with pytest.raises(ValueError, match="User 'nasa' not found.") as exc:
@@ -3,7 +3,7 @@ import pytest
 import shutil
 import tempfile
 from unittest import mock
-from crawlinsta.collecting.media import download_media
+from crawlinsta.collecting.media import download_media, download_media_many
 from .base_mocked_driver import BaseMockedDriver
 
 
@@ -16,8 +16,7 @@ class MockedDriver(BaseMockedDriver):
         self.requests = [request]
 
 
-@mock.patch("crawlinsta.collecting.media.time.sleep", return_value=None)
-def test_download_media(mocked_sleep):
+def test_download_media():
     driver = MockedDriver()
     tmp_dir = tempfile.mkdtemp()
     tmp_filename = os.path.join(tmp_dir, "image")
@@ -25,13 +24,42 @@ def test_download_media(mocked_sleep):
     with open("tests/resources/download_media/image.jpg", "rb") as file1:
         with open(f"{tmp_filename}.jpeg", "rb") as file2:
             assert file1.read() == file2.read()
+    # the captured requests of the caller are kept
+    assert len(driver.requests) == 1
     shutil.rmtree(tmp_dir)
 
 
-@mock.patch("crawlinsta.collecting.media.time.sleep", return_value=None)
-@mock.patch("crawlinsta.collecting.media.search_request", return_value=None)
-def test_download_media_fail(mocked_search_request, mocked_sleep):
-    driver = MockedDriver()
+class MockedDriverContentTypeParameters(MockedDriver):
+    def get(self, url):
+        super().get(url)
+        self.requests[0].response.headers["Content-Type"] = 'video/mp4; codecs="avc1.4D401E"'
+
+
+def test_download_media_content_type_parameters():
+    driver = MockedDriverContentTypeParameters()
+    tmp_dir = tempfile.mkdtemp()
+    tmp_filename = os.path.join(tmp_dir, "video")
+    download_media(driver, "https://dummy.video.com", tmp_filename)
+    assert os.listdir(tmp_dir) == ["video.mp4"]
+    shutil.rmtree(tmp_dir)
+
+
+def test_download_media_fail():
+    driver = BaseMockedDriver()
     with pytest.raises(ValueError) as exc:
         download_media(driver, "https://dummy.image.com", "dummy_filename")
     assert str(exc.value) == "Media url 'https://dummy.image.com' not found."
+
+
+def test_download_media_many():
+    drivers = [MockedDriver(), MockedDriver()]
+    tmp_dir = tempfile.mkdtemp()
+    tmp_filenames = [os.path.join(tmp_dir, f"image{i}") for i in range(3)]
+    download_media_many(drivers, [(f"https://dummy.image{i}.com", tmp_filename)
+                                  for i, tmp_filename in enumerate(tmp_filenames)])
+    with open("tests/resources/download_media/image.jpg", "rb") as file1:
+        expected = file1.read()
+    for tmp_filename in tmp_filenames:
+        with open(f"{tmp_filename}.jpeg", "rb") as file2:
+            assert file2.read() == expected
+    shutil.rmtree(tmp_dir)
@@ -1,8 +1,9 @@
 import json
 import pytest
 from unittest import mock
+from selenium.webdriver.common.keys import Keys
 from urllib.parse import urlencode, quote
-from crawlinsta.collecting.friendship_status import get_friendship_status
+from crawlinsta.collecting.friendship_status import get_friendship_status, get_friendship_statuses
 from crawlinsta.constants import INSTAGRAM_DOMAIN, API_VERSION, JsonResponseContentType
 from .base_mocked_driver import BaseMockedDriver
 
@@ -73,6 +74,35 @@ def test_get_friendship_status(mocked_sleep, username1, username2, user_id1, use
     assert result == expected
 
 
+@pytest.mark.parametrize("username1, username2, user_id1, user_id2",
+                         [("nasa", "astro_frankrubio", "528817151", "54688074404"),
+                          ("regina_steinhauer", "nasa", "2057642850", "528817151")])
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_get_friendship_status_second_driver(mocked_sleep, username1, username2, user_id1, user_id2):
+    user_dict = {
+        username1: {
+            "profile_file": f"tests/resources/friendship/{username1}_profile.json",
+            "id": user_id1,
+            "data_file": f"tests/resources/friendship/{username1}_following_search_{username2}.json",
+            "searching_username": username2
+        },
+        username2: {
+            "profile_file": f"tests/resources/friendship/{username2}_profile.json",
+            "id": user_id2,
+            "data_file": f"tests/resources/friendship/{username2}_following_search_{username1}.json",
+            "searching_username": username1
+        }
+    }
+    driver = MockedDriver(user_dict)
+    second_driver = MockedDriver(user_dict)
+    result = get_friendship_status(driver, username1, username2, second_driver=second_driver)
+    with open(f"tests/resources/friendship/{username1}_{username2}_result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+    assert driver.username == username1
+    assert second_driver.username == username2
+
+
 @pytest.mark.parametrize("username1, username2, user_id1, user_id2",
                          [("nasa", "astro_frankrubio", "528817151", "54688074404"),
                           ("regina_steinhauer", "nasa", "2057642850", "528817151")])
@@ -102,6 +132,33 @@ def test_get_friendship_status_no_request_found(mocked_logger, mocked_search_req
     mocked_logger.warning.assert_has_calls(calls, any_order=False)
 
 
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_get_friendship_status_no_request_found_not_cached(mocked_sleep):
+    username1, username2 = "nasa", "astro_frankrubio"
+    user_dict = {
+        username1: {
+            "profile_file": f"tests/resources/friendship/{username1}_profile.json",
+            "id": "528817151",
+            "data_file": f"tests/resources/friendship/{username1}_following_search_{username2}.json",
+            "searching_username": username2
+        },
+        username2: {
+            "profile_file": f"tests/resources/friendship/{username2}_profile.json",
+            "id": "54688074404",
+            "data_file": f"tests/resources/friendship/{username2}_following_search_{username1}.json",
+            "searching_username": username1
+        }
+    }
+    with mock.patch("crawlinsta.collecting.friendship_status.search_request", return_value=None):
+        result = get_friendship_status(MockedDriver(user_dict), username1, username2)
+    assert result == {"following": False, "followed_by": False}
+
+    result = get_friendship_status(MockedDriver(user_dict), username1, username2)
+    with open(f"tests/resources/friendship/{username1}_{username2}_result.json", "r") as file:
+        expected = json.load(file)
+    assert result == expected
+
+
 class MockedDriverPrivate(MockedDriver):
     def __init__(self, user_dict):
         self.user_dict = user_dict
@@ -172,3 +229,75 @@ def test_get_friendship_status_no_request(mocked_sleep):
     with pytest.raises(ValueError) as exc_info:
         get_friendship_status(BaseMockedDriver(), "nasa", "astro_frankrubio")
     assert str(exc_info.value) == "User 'astro_frankrubio' not found."
+
+
+class MockedDriverSearchBox(MockedDriver):
+    def __init__(self, user_dict):
+        super().__init__(user_dict)
+        self.dialog = "following"
+
+    def find_element(self, by, value):
+        if value.endswith("/'][@role='link']"):
+            self.dialog = value.rsplit("/", 2)[-2]
+        self.requests = []
+        element = mock.MagicMock()
+        element.send_keys.side_effect = self.search
+        return element
+
+    def search(self, text):
+        if text.startswith(Keys.BACKSPACE):
+            return
+        user_id = self.user_dict[self.username]["id"]
+        query_str = urlencode(dict(query=text), quote_via=quote)
+        url = f"{INSTAGRAM_DOMAIN}/{API_VERSION}/friendships/{user_id}/{self.dialog}/?{query_str}"
+
+        with open(f"tests/resources/friendship/{self.username}_{self.dialog}_search_{text}.json", "r") as file:
+            data = json.load(file)
+        response = mock.Mock(headers={"Content-Type": JsonResponseContentType.application_json,
+                                      'Content-Encoding': 'identity'},
+                             body=json.dumps(data).encode())
+        self.requests = [mock.Mock(url=url, response=response)]
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_get_friendship_statuses(mocked_sleep):
+    user_dict = {
+        "nasa": {"profile_file": "tests/resources/friendship/nasa_profile.json", "id": "528817151"},
+        "astro_frankrubio": {"profile_file": "tests/resources/friendship/astro_frankrubio_profile.json",
+                             "id": "54688074404"},
+        "regina_steinhauer": {"profile_file": "tests/resources/friendship/regina_steinhauer_profile.json",
+                              "id": "2057642850"},
+    }
+    driver = MockedDriverSearchBox(user_dict)
+    with mock.patch.object(driver, "get", wraps=driver.get) as mocked_get:
+        result = get_friendship_statuses(driver, "nasa", ["astro_frankrubio", "regina_steinhauer"])
+    assert result == {"astro_frankrubio": {"following": True, "followed_by": True},
+                      "regina_steinhauer": {"following": False, "followed_by": False}}
+    # the followings and the followers of nasa are searched within one page load each
+    assert [c.args[0] for c in mocked_get.call_args_list] == [f"{INSTAGRAM_DOMAIN}/nasa/"] * 2
+
+    # the statuses are served from the cache afterwards
+    with mock.patch.object(driver, "get") as mocked_get:
+        assert get_friendship_status(driver, "nasa", "astro_frankrubio") == {"following": True, "followed_by": True}
+    mocked_get.assert_not_called()
+
+
+@mock.patch("crawlinsta.collecting.base.time.sleep", return_value=None)
+def test_get_friendship_statuses_second_driver(mocked_sleep):
+    user_dict = {
+        "nasa": {"profile_file": "tests/resources/friendship/nasa_profile.json", "id": "528817151"},
+        "astro_frankrubio": {"profile_file": "tests/resources/friendship/astro_frankrubio_profile.json",
+                             "id": "54688074404"},
+        "regina_steinhauer": {"profile_file": "tests/resources/friendship/regina_steinhauer_profile.json",
+                              "id": "2057642850"},
+    }
+    driver = MockedDriverSearchBox(user_dict)
+    second_driver = MockedDriverSearchBox(user_dict)
+    result = get_friendship_statuses(driver, "nasa", ["astro_frankrubio", "regina_steinhauer"],
+                                     second_driver=second_driver)
+    assert result == {"astro_frankrubio": {"following": True, "followed_by": True},
+                      "regina_steinhauer": {"following": False, "followed_by": False}}
+    assert driver.username == "nasa"
+    assert driver.dialog == "following"
+    assert second_driver.username == "nasa"
+    assert second_driver.dialog == "followers"
@@ -1,3 +1,4 @@
+import pytest
 from crawlinsta.data_extraction import (
     extract_id, extract_post_urls, extract_music_info, extract_sound_info,
     extract_music, extract_post, create_users_list
@@ -472,3 +473,11 @@ def test_create_users_list():
     assert users[1].profile_pic_url == "https://www.instagram.com/p/1234567891"
     assert users[1].is_verified is False
     assert users[1].is_private is True
+
+
+@pytest.mark.parametrize("n, expected_ids", [(None, ["1", "2", "3"]), (0, []), (1, ["1"]),
+                                             (2, ["1", "2"]), (5, ["1", "2", "3"])])
+def test_create_users_list_with_n(n, expected_ids):
+    user_info_list = [{"users": [{"pk": "1"}, {"pk": "2"}]}, {"users": [{"pk": "3"}]}]
+    users = create_users_list(user_info_list, "users", n)
+    assert [user.id for user in users] == expected_ids
@@ -1,4 +1,8 @@
-from crawlinsta.decorators import driver_implicit_wait
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from crawlinsta.decorators import driver_implicit_wait, driver_capture_scopes, ttl_cache, skip_caching
 from unittest import mock
 
 
@@ -13,3 +17,141 @@ def test_driver_implicit_wait():
 
     test_function(driver)
     driver.implicitly_wait.assert_called_once_with(seconds)
+
+
+def test_driver_capture_scopes():
+    driver = mock.Mock(scopes=[".*"])
+    scopes_in_function = []
+
+    @driver_capture_scopes([".*api.*"])
+    def test_function(chrome_driver):
+        scopes_in_function.append(chrome_driver.scopes)
+        raise ValueError("User 'user1' not found.")
+
+    with pytest.raises(ValueError):
+        test_function(driver)
+    assert scopes_in_function == [[".*api.*"]]
+    assert driver.scopes == [".*"]
+
+
+def logged_in_driver(user_id="1234567890"):
+    return mock.Mock(get_cookie=mock.Mock(return_value={"name": "ds_user_id", "value": user_id}))
+
+
+def test_ttl_cache():
+    driver = logged_in_driver()
+    calls = []
+
+    @ttl_cache(300)
+    def test_function(chrome_driver, username, n=10):
+        calls.append((username, n))
+        return {"username": username, "n": n}
+
+    assert test_function(driver, "user1") == {"username": "user1", "n": 10}
+    assert test_function(driver, "user1", n=10) == {"username": "user1", "n": 10}
+    assert test_function(logged_in_driver(), "user1", 10) == {"username": "user1", "n": 10}
+    assert calls == [("user1", 10)]
+    driver.get_cookie.assert_called_with("ds_user_id")
+
+    result = test_function(driver, "user1")
+    result["n"] = 20
+    assert test_function(driver, "user1") == {"username": "user1", "n": 10}
+
+    test_function(driver, "user1", 20)
+    assert calls == [("user1", 10), ("user1", 20)]
+
+    test_function.invalidate("user1")
+    test_function(driver, "user1")
+    assert calls == [("user1", 10), ("user1", 20), ("user1", 10)]
+
+    test_function.cache_clear()
+    test_function(driver, "user1")
+    assert len(calls) == 4
+
+    # what is visible depends on the logged in account
+    test_function(logged_in_driver("9876543210"), "user1")
+    assert len(calls) == 5
+
+
+def test_ttl_cache_error_not_cached():
+    calls = []
+
+    @ttl_cache(300)
+    def test_function(chrome_driver, username):
+        calls.append(username)
+        raise ValueError(f"User '{username}' not found.")
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            test_function(logged_in_driver(), "user1")
+    assert calls == ["user1", "user1"]
+
+
+def test_ttl_cache_skip_caching():
+    calls = []
+
+    @ttl_cache(300)
+    def inner_function(chrome_driver, username):
+        calls.append(("inner", username))
+        skip_caching()
+        return {"username": username, "count": 0}
+
+    @ttl_cache(300)
+    def outer_function(chrome_driver, username):
+        calls.append(("outer", username))
+        return inner_function(chrome_driver, username)
+
+    for _ in range(2):
+        assert outer_function(logged_in_driver(), "user1") == {"username": "user1", "count": 0}
+    assert calls == [("outer", "user1"), ("inner", "user1")] * 2
+
+
+def test_ttl_cache_concurrent_calls():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @ttl_cache(300)
+    def test_function(chrome_driver, username):
+        calls.append(username)
+        started.set()
+        release.wait(5)
+        return {"username": username}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = executor.submit(test_function, logged_in_driver(), "user1")
+        started.wait(5)
+        others = [executor.submit(test_function, logged_in_driver(), "user1") for _ in range(2)]
+        release.set()
+        results = [first.result()] + [future.result() for future in others]
+    assert results == [{"username": "user1"}] * 3
+    assert calls == ["user1"]
+
+
+def test_ttl_cache_concurrent_calls_uncached_result():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @ttl_cache(300)
+    def test_function(chrome_driver, username):
+        calls.append(username)
+        started.set()
+        release.wait(5)
+        skip_caching()
+        return {"username": username, "count": 0}
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        first = executor.submit(test_function, logged_in_driver(), "user1")
+        started.wait(5)
+        others = [executor.submit(test_function, logged_in_driver(), "user1") for _ in range(2)]
+        # give the other calls the time to start waiting for the first one
+        time.sleep(0.2)
+        release.set()
+        results = [first.result()] + [future.result() for future in others]
+    assert results == [{"username": "user1", "count": 0}] * 3
+    assert calls == ["user1"]
+
+    # the result isn't cached, the next call collects it again
+    test_function(logged_in_driver(), "user1")
+    assert calls == ["user1", "user1"]
@@ -1,11 +1,15 @@
 import pytest
 from crawlinsta.utils import (
     filter_requests, search_request, get_json_data, get_media_type,
-    find_brackets
+    find_brackets, get_default_result, load_json, wait_for_request, wait_for_matching_request,
+    get_request_data, parse_form_data, random_seconds, get_viewer_id
 )
+from crawlinsta.schemas import Users
+from .test_collecting.base_mocked_driver import BaseMockedDriver
 from crawlinsta.constants import JsonResponseContentType, INSTAGRAM_DOMAIN, API_VERSION
 from seleniumwire.request import Request, Response
 from unittest import mock
+from urllib.parse import parse_qs, urlencode
 
 
 @mock.patch("crawlinsta.utils.logger", autospec=True)
@@ -123,3 +127,140 @@ def test_find_brackets():
 
     result = find_brackets("{{{{}}}}}{}")
     assert result == [(3, 4), (2, 5), (1, 6), (0, 7)]
+
+
+def test_get_default_result():
+    result = get_default_result(Users)
+    assert result == {"users": [], "count": 0}
+
+    result["users"].append({"username": "dummy"})
+    assert get_default_result(Users) == {"users": [], "count": 0}
+
+
+def test_load_json():
+    assert load_json(b'{"users": [{"pk": 123}]}') == {"users": [{"pk": 123}]}
+    assert load_json('{"users": []}') == {"users": []}
+
+
+@mock.patch("crawlinsta.utils.orjson", None)
+def test_load_json_without_orjson():
+    assert load_json(b'{"users": [{"pk": 123}]}') == {"users": [{"pk": 123}]}
+
+
+class DelayedRequestsDriver(BaseMockedDriver):
+    def __init__(self, request, polls):
+        super().__init__()
+        self.request = request
+        self.polls = polls
+
+    @property
+    def requests(self):
+        self.polls -= 1
+        return [self.request] if self.polls <= 0 else []
+
+    @requests.setter
+    def requests(self, value):
+        pass
+
+
+def test_wait_for_request(clock):
+    request = Request(method="GET", url="http://dummy.com", headers=[])
+    request.response = Response(status_code=200, reason="ok",
+                                headers=[('Content-Type', "application/json; charset=utf-8")])
+    driver = DelayedRequestsDriver(request, polls=3)
+    assert wait_for_request(driver, "http://dummy.com", timeout=10, poll_frequency=0.5) == [request]
+    assert clock.sleeps == [0.5, 0.5]
+
+
+def test_wait_for_matching_request(clock):
+    other_request = Request(method="GET", url="http://other.com", headers=[])
+    request = Request(method="GET", url="http://dummy.com", headers=[])
+    for captured_request in (other_request, request):
+        captured_request.response = Response(status_code=200, reason="ok",
+                                             headers=[('Content-Type', "image/jpeg")])
+    driver = BaseMockedDriver()
+    driver.requests = [other_request, request]
+    assert wait_for_matching_request(driver, "http://dummy.com", response_content_type=None) is request
+    assert clock.sleeps == []
+
+    driver.requests = [other_request]
+    assert wait_for_matching_request(driver, "http://dummy.com", response_content_type=None) is None
+    assert clock.now == 10
+
+
+@mock.patch("crawlinsta.utils.logger", autospec=True)
+def test_wait_for_request_timeout(mocked_logger, clock):
+    driver = BaseMockedDriver()
+    assert wait_for_request(driver, "http://dummy.com", timeout=10, poll_frequency=3) == []
+    assert clock.sleeps == [3, 3, 3, 1]
+    assert clock.now == 10
+    mocked_logger.error.assert_not_called()
+    mocked_logger.warning.assert_called_once_with("Timed out after 10 seconds waiting for the response "
+                                                  "to the url 'http://dummy.com'.")
+
+
+class GrowingRequestsDriver(BaseMockedDriver):
+    def __init__(self, old_request, new_request, polls):
+        super().__init__()
+        self.old_request = old_request
+        self.new_request = new_request
+        self.polls = polls
+
+    @property
+    def requests(self):
+        self.polls -= 1
+        return [self.old_request, self.new_request] if self.polls <= 0 else [self.old_request]
+
+    @requests.setter
+    def requests(self, value):
+        pass
+
+
+def test_wait_for_request_checks_each_request_once():
+    old_request = Request(method="POST", url="http://dummy.com", headers=[], body=b"after=")
+    new_request = Request(method="POST", url="http://dummy.com", headers=[], body=b"after=abc")
+    for request_id, request in enumerate((old_request, new_request)):
+        request.id = str(request_id)
+        request.response = Response(status_code=200, reason="ok",
+                                    headers=[('Content-Type', "application/json; charset=utf-8")])
+    search_func = mock.Mock(side_effect=lambda request: request.body == b"after=abc")
+    driver = GrowingRequestsDriver(old_request, new_request, polls=3)
+    assert wait_for_request(driver, "http://dummy.com", "application/json; charset=utf-8",
+                            search_func) == [old_request, new_request]
+    assert search_func.call_args_list == [mock.call(old_request), mock.call(new_request)]
+
+
+def test_get_request_data():
+    request = Request(method="POST", url="http://dummy.com", headers=[],
+                      body=b"av=123&variables=%7B%22username%22%3A%22dummy%22%7D")
+    request_data, variables = get_request_data(request)
+    assert request_data == {"av": ["123"], "variables": ['{"username":"dummy"}']}
+    assert variables == {"username": "dummy"}
+
+    request.body = b""
+    assert get_request_data(request) == (request_data, variables)
+
+
+def test_get_request_data_mocked_request():
+    request = mock.Mock(body=b"av=123")
+    assert get_request_data(request) == ({"av": ["123"]}, {})
+
+
+@pytest.mark.parametrize("body", [b"", b"av=123", b"av=123&av=456&empty=&novalue",
+                                  b"a+b=c+d&x%26y=%7B%22q%22%3A%22a%3Db%22%7D",
+                                  urlencode(dict(av="17841461911219001", doc_id="7354141574647290",
+                                                 variables='{"username":"dummy user","after":"QVFD=="}')).encode()])
+def test_parse_form_data(body):
+    assert parse_form_data(body) == parse_qs(body.decode())
+
+
+def test_random_seconds():
+    seconds = {random_seconds(4, 6) for _ in range(200)}
+    assert seconds == {4, 5, 6}
+
+
+def test_get_viewer_id():
+    driver = mock.Mock(get_cookie=mock.Mock(return_value={"name": "ds_user_id", "value": "1234567890"}))
+    assert get_viewer_id(driver) == "1234567890"
+    driver.get_cookie.assert_called_once_with("ds_user_id")
+    assert get_viewer_id(mock.Mock(get_cookie=mock.Mock(return_value=None))) is None
@@ -0,0 +1,20 @@
+from crawlinsta.webdriver import get_seleniumwire_options, SELENIUMWIRE_OPTIONS, get_chrome_options, CHROME_PREFS
+
+
+def test_get_seleniumwire_options():
+    assert get_seleniumwire_options() == SELENIUMWIRE_OPTIONS
+    options = get_seleniumwire_options(request_storage_max_size=100, verify_ssl=True)
+    assert options == {"request_storage": "memory",
+                       "request_storage_max_size": 100,
+                       "mitm_http2": True,
+                       "disable_encoding": True,
+                       "verify_ssl": True}
+    assert SELENIUMWIRE_OPTIONS["request_storage_max_size"] == 500
+
+
+def test_get_chrome_options():
+    options = get_chrome_options()
+    assert options.experimental_options["prefs"] == CHROME_PREFS
+    options = get_chrome_options(**{"profile.managed_default_content_settings.images": 1})
+    assert options.experimental_options["prefs"] == {"profile.managed_default_content_settings.images": 1}
+    assert CHROME_PREFS["profile.managed_default_content_settings.images"] == 2